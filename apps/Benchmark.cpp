@@ -9,6 +9,7 @@
 #include <iomanip>
 #include <iostream>
 #include <string>
+#include <string_view>
 #include <unistd.h>
 #include <vector>
 
@@ -27,30 +28,40 @@ static std::vector<TestCase> loadSuite(const std::string &path) {
         return {};
     }
 
+    // Pull the whole file in with one read and scan lines as views into it,
+    // rather than a getline() call and string copy per line.
+    std::string text(static_cast<size_t>(std::filesystem::file_size(path)), '\0');
+    f.read(text.data(), static_cast<std::streamsize>(text.size()));
+    text.resize(static_cast<size_t>(f.gcount()));
+
     std::vector<TestCase> cases;
     TestCase cur;
     bool inExpected = false;
-    std::string line;
 
-    while (std::getline(f, line)) {
-        if (line.find("\"state\"") != std::string::npos) {
+    for (size_t pos = 0; pos < text.size();) {
+        size_t eol = text.find('\n', pos);
+        if (eol == std::string::npos) eol = text.size();
+        std::string_view line(text.data() + pos, eol - pos);
+        pos = eol + 1;
+
+        if (line.find("\"state\"") != std::string_view::npos) {
             size_t colon = line.find(':');
             size_t q1    = line.find('"', colon + 1);
-            size_t q2    = (q1 != std::string::npos) ? line.find('"', q1 + 1) : std::string::npos;
-            if (q2 != std::string::npos)
-                cur.state = line.substr(q1 + 1, q2 - q1 - 1);
+            size_t q2    = (q1 != std::string_view::npos) ? line.find('"', q1 + 1) : std::string_view::npos;
+            if (q2 != std::string_view::npos)
+                cur.state = std::string(line.substr(q1 + 1, q2 - q1 - 1));
             inExpected = false;
-        } else if (line.find("\"expected\"") != std::string::npos) {
+        } else if (line.find("\"expected\"") != std::string_view::npos) {
             cur.expected.clear();
             inExpected = true;
         } else if (inExpected) {
             size_t q1 = line.find('"');
-            size_t q2 = (q1 != std::string::npos) ? line.find('"', q1 + 1) : std::string::npos;
-            if (q2 != std::string::npos && q2 > q1 + 1)
-                cur.expected.push_back(line.substr(q1 + 1, q2 - q1 - 1));
-            if (line.find(']') != std::string::npos) {
+            size_t q2 = (q1 != std::string_view::npos) ? line.find('"', q1 + 1) : std::string_view::npos;
+            if (q2 != std::string_view::npos && q2 > q1 + 1)
+                cur.expected.emplace_back(line.substr(q1 + 1, q2 - q1 - 1));
+            if (line.find(']') != std::string_view::npos) {
                 inExpected = false;
-                cases.push_back(cur);
+                cases.push_back(std::move(cur));
                 cur = {};
             }
         }
@@ -69,25 +80,44 @@ static std::string isoTimestamp() {
     return buf;
 }
 
-static void appendResult(const std::string &csvPath,
-                         const std::string &checkpoint,
-                         const std::string &evaluatorName,
-                         const std::string &suiteName,
-                         int passed, int total) {
-    std::filesystem::create_directories(std::filesystem::path(csvPath).parent_path());
-    bool needsHeader = !std::filesystem::exists(csvPath);
-    std::ofstream f(csvPath, std::ios::app);
-    if (needsHeader)
-        f << "timestamp,checkpoint,evaluator,suite,passed,total,score_pct\n";
-    double pct = total > 0 ? 100.0 * passed / total : 0.0;
-    f << isoTimestamp() << ","
-      << checkpoint << ","
-      << evaluatorName << ","
-      << suiteName << ","
-      << passed << ","
-      << total << ","
-      << std::fixed << std::setprecision(1) << pct << "\n";
-}
+// One writer per run: the file is opened on the first append and kept open,
+// instead of re-creating the directory, re-checking for the header and
+// re-opening the file for every row. Rows are flushed as they are written so
+// results already recorded survive if a later stage of the battery crashes.
+class ResultLog {
+  public:
+    explicit ResultLog(std::string csvPath) : csvPath_(std::move(csvPath)) {}
+
+    void append(const std::string &checkpoint,
+                const std::string &evaluatorName,
+                const std::string &suiteName,
+                int passed, int total) {
+        if (!f_.is_open()) open();
+        double pct = total > 0 ? 100.0 * passed / total : 0.0;
+        f_ << isoTimestamp() << ","
+           << checkpoint << ","
+           << evaluatorName << ","
+           << suiteName << ","
+           << passed << ","
+           << total << ","
+           << std::fixed << std::setprecision(1) << pct << "\n" << std::flush;
+    }
+
+  private:
+    void open() {
+        std::filesystem::create_directories(std::filesystem::path(csvPath_).parent_path());
+        // Decide on the header from the opened file itself, not a separate
+        // exists() check beforehand: another run creating the file in between
+        // can no longer cause a duplicate header, and an empty file gets one.
+        f_.open(csvPath_, std::ios::app);
+        f_.seekp(0, std::ios::end);
+        if (f_.tellp() == 0)
+            f_ << "timestamp,checkpoint,evaluator,suite,passed,total,score_pct\n";
+    }
+
+    std::string csvPath_;
+    std::ofstream f_;
+};
 
 // ── Arena (NN vs Heuristic) ───────────────────────────────────────────────────
 
@@ -114,10 +144,15 @@ static ArenaResult runArena(Evaluator *candidateEval, Evaluator *opponentEval,
     oppCfg.arenaSize            = GameUtils::arenaSizeFromEnv();
     oppCfg.evaluator            = opponentEval;
 
+    // One pair of searches for the whole match, reset between games: constructing
+    // them per game re-allocated both node arenas and re-faulted their pages.
+    ParallelMCTS candMcts(candCfg), oppMcts(oppCfg);
+
     for (int g = 0; g < numGames; g++) {
         bool candIsBlack = (g % 2 == 0);
 
-        ParallelMCTS candMcts(candCfg), oppMcts(oppCfg);
+        candMcts.reset();
+        oppMcts.reset();
         PenteGame game(gameConfig);
         game.reset();
 
@@ -339,6 +374,8 @@ int main(int argc, char *argv[]) {
               << "  model : " << modelPath << "\n"
               << "  output: " << outPath << "\n\n";
 
+    ResultLog results(outPath);
+
     // Compute relative model path for CSV once
     std::string relModelPath = modelPath;
     const std::string projectRoot = PROJECT_ROOT;
@@ -390,7 +427,7 @@ int main(int argc, char *argv[]) {
             auto res = runSuiteCheck(evaluator, nullptr, openThreePath, false, verbose);
             if (res.total == 0) return 1;
             printSuiteResult(res, false);
-            appendResult(outPath, relModelPath, evaluatorName, "open-three-suite", res.passed, res.total);
+            results.append(relModelPath, evaluatorName, "open-three-suite", res.passed, res.total);
             std::cout << "Appended to " << outPath << "\n";
         }
 
@@ -411,7 +448,7 @@ int main(int argc, char *argv[]) {
                 auto res = runSuiteCheck(nnEval.get(), &mcts800, openThreePath, false, verbose);
                 if (res.total == 0) return 1;
                 printSuiteResult(res, false);
-                appendResult(outPath, relModelPath, "nn@800", "open-three-suite", res.passed, res.total);
+                results.append(relModelPath, "nn@800", "open-three-suite", res.passed, res.total);
                 std::cout << "Appended to " << outPath << "\n";
             }
 
@@ -421,7 +458,7 @@ int main(int argc, char *argv[]) {
                 auto res = runSuiteCheck(nnEval.get(), nullptr, valueSuitePath, true, verbose);
                 if (res.total == 0) return 1;
                 printSuiteResult(res, true);
-                appendResult(outPath, relModelPath, "nn", "value-suite-sign", res.passed, res.total);
+                results.append(relModelPath, "nn", "value-suite-sign", res.passed, res.total);
                 std::cout << "Appended to " << outPath << "\n";
             }
 
@@ -445,7 +482,7 @@ int main(int argc, char *argv[]) {
                           << "  draws " << ar.draws
                           << "  (" << std::fixed << std::setprecision(1) << nnPct << "% nn win rate)\n";
                 std::string arenaEval = "nn@800-vs-" + std::string(opp.label);
-                appendResult(outPath, relModelPath, arenaEval, "arena", ar.nnWins, arenaGames);
+                results.append(relModelPath, arenaEval, "arena", ar.nnWins, arenaGames);
                 std::cout << "Appended to " << outPath << "\n";
             }
         }
@@ -487,7 +524,7 @@ int main(int argc, char *argv[]) {
 
     std::string suiteName = std::filesystem::path(suitePath).stem().string();
     if (runValueSuite) suiteName += "-value-sign";
-    appendResult(outPath, relModelPath, evaluatorName, suiteName, res.passed, res.total);
+    results.append(relModelPath, evaluatorName, suiteName, res.passed, res.total);
     std::cout << "Appended to " << outPath << "\n";
 
 #ifdef WITH_TORCH
@@ -531,7 +568,7 @@ int main(int argc, char *argv[]) {
                       << "  (" << std::fixed << std::setprecision(1) << nnPct << "% nn win rate)\n";
 
             std::string arenaLabel = "nn@" + std::to_string(arenaSims) + "-vs-" + opponentLabel + "@" + std::to_string(oppSims);
-            appendResult(outPath, relModelPath, arenaLabel, "arena", ar.nnWins, arenaGames);
+            results.append(relModelPath, arenaLabel, "arena", ar.nnWins, arenaGames);
             std::cout << "Appended arena result to " << outPath << "\n";
         }
     }
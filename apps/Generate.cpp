@@ -103,7 +103,8 @@ int main(int argc, char *argv[]) {
     Evaluator &eval = *evalPtr;
 
     std::mt19937 rng(std::random_device{}());
-    std::vector<torch::Tensor> allPlanes, allCaptures, allPolicies, allValues;
+    std::vector<torch::Tensor> allPlanes, allCaptures, allPolicies;
+    std::vector<float> allValues;  // flat (z, rootQ) pairs — one tensor built at the end
     int totalPositions = 0, bWins = 0, wWins = 0, draws = 0;
     int lastGameMoves = 0;
 
@@ -127,10 +128,14 @@ int main(int argc, char *argv[]) {
         }
 
         for (auto &ex : examples) {
-            allPlanes.push_back(ex.planes);
+            // Keep only the two stone planes, as uint8, while accumulating: the
+            // float planes are ~10x larger and would be narrowed the same way
+            // at the end anyway.
+            allPlanes.push_back(ex.planes.slice(0, 0, 2).to(torch::kU8));
             allCaptures.push_back(ex.captures);
             allPolicies.push_back(ex.policy);
-            allValues.push_back(torch::tensor({ex.outcome, ex.rootValue}));
+            allValues.push_back(ex.outcome);
+            allValues.push_back(ex.rootValue);
             totalPositions++;
         }
 
@@ -154,14 +159,14 @@ int main(int argc, char *argv[]) {
               << "  avg/game: " << std::setprecision(1) << totalSecs / gamesPerIter << "s"
               << "  avg/pos: "  << std::setprecision(3) << (totalPositions > 0 ? totalSecs / totalPositions : 0.0) << "s\n";
 
-    // Store compactly: stone planes only as uint8, policies as float16
-    // (decodeStates reconstructs the full 5-plane float input at train time).
-    // Values are stored unblended as [N, 2] = (z, rootQ); the training target
-    // is blended at train time (blendValueTargets).
-    auto newStates   = torch::stack(allPlanes,   0).slice(1, 0, 2).to(torch::kU8).contiguous();
+    // Store compactly: stone planes only as uint8 (already narrowed above),
+    // policies as float16 (decodeStates reconstructs the full 5-plane float
+    // input at train time). Values are stored unblended as [N, 2] = (z, rootQ);
+    // the training target is blended at train time (blendValueTargets).
+    auto newStates   = torch::stack(allPlanes,   0);
     auto newCaptures = torch::stack(allCaptures, 0);
     auto newPolicies = torch::stack(allPolicies, 0).to(torch::kHalf);
-    auto newValues   = torch::stack(allValues,   0);
+    auto newValues   = torch::tensor(allValues).view({-1, 2});
 
     std::cout << "\n── " << (bootstrap ? "Bootstrap" : "Buffer")
               << " ───────────────────────────────────────────────────────\n";
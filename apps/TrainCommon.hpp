@@ -3,7 +3,11 @@
 
 #include <filesystem>
 #include <iostream>
+#include <random>
+#include <string>
+#include <system_error>
 #include <torch/torch.h>
+#include <unistd.h>
 
 // Buffer counts are unique positions; the 8 board symmetries are applied at
 // sample time (augmentBatch), not stored. Values below match the effective
@@ -111,6 +115,13 @@ inline ReplayBuffer loadBuffer(const std::string &path) {
     return buf;
 }
 
+// Write to a sibling temp file and rename over the target. The rename is atomic
+// on POSIX, so a train/inspect process loading the buffer while generate is
+// saving it sees either the old or the new archive — never a torn one — and
+// the reader never has to wait for the writer to finish. The temp name is
+// unique per process and call, so two generate runs saving the same buffer
+// never write into each other's temp file (the later rename wins). A failed
+// write removes its temp file and leaves the target untouched.
 inline void saveBuffer(const ReplayBuffer &buf, const std::string &path) {
     std::filesystem::create_directories(std::filesystem::path(path).parent_path());
     torch::serialize::OutputArchive ar;
@@ -118,7 +129,16 @@ inline void saveBuffer(const ReplayBuffer &buf, const std::string &path) {
     ar.write("captures", buf.captures);
     ar.write("policies", buf.policies);
     ar.write("values",   buf.values);
-    ar.save_to(path);
+    const std::string tmpPath = path + ".tmp." + std::to_string(::getpid()) + "." +
+                                std::to_string(std::random_device{}());
+    try {
+        ar.save_to(tmpPath);
+        std::filesystem::rename(tmpPath, path);
+    } catch (...) {
+        std::error_code ec;
+        std::filesystem::remove(tmpPath, ec);
+        throw;
+    }
 }
 
 inline ReplayBuffer mergeAndTrim(ReplayBuffer existing,
@@ -1,6 +1,7 @@
 #ifndef BITBOARD_HPP
 #define BITBOARD_HPP
 
+#include <array>
 #include <cstdint>
 #include <utility>
 #include <vector>
@@ -14,20 +15,45 @@ class BitBoard {
     uint64_t board[NUM_SEGMENTS];
     int boardSize;
 
-    // Masks to prevent wrapping around the edges
-    static uint64_t MASK_NOT_COL_0[NUM_SEGMENTS];
-    static uint64_t MASK_NOT_COL_18[NUM_SEGMENTS];
-    static uint64_t MASK_NOT_COL_0_1[NUM_SEGMENTS];
-    static uint64_t MASK_NOT_COL_17_18[NUM_SEGMENTS];
-    static bool masksInitialized;
+    using SegmentMask = std::array<uint64_t, NUM_SEGMENTS>;
+
+    // Every in-board cell outside columns [firstCol, lastCol]; the dead bits
+    // past the last cell stay clear, so ~occupied never suggests off-board moves
+    static constexpr SegmentMask columnsExcluded(int firstCol, int lastCol) {
+        SegmentMask mask{};
+        for (int cell = 0; cell < MAX_BOARD_SIZE * MAX_BOARD_SIZE; ++cell) {
+            int col = cell % MAX_BOARD_SIZE;
+            if (col < firstCol || col > lastCol)
+                mask[cell / BITS_PER_UINT64] |= 1ULL << (cell % BITS_PER_UINT64);
+        }
+        return mask;
+    }
+
+    // Masks to prevent wrapping around the edges. Built at compile time (defined
+    // below the class), so they are read-only and need no lazy initialisation.
+    static const SegmentMask MASK_NOT_COL_0;
+    static const SegmentMask MASK_NOT_COL_18;
+    static const SegmentMask MASK_NOT_COL_0_1;
+    static const SegmentMask MASK_NOT_COL_17_18;
 
     int toIndex(int x, int y) const { return y * boardSize + x; }
 
+    // Cell index -> (x, y) on a full-size board, so decoding a set bit is one
+    // load instead of a division by the (runtime) board size.
+    struct CellCoord {
+        uint8_t x, y;
+    };
+    static constexpr std::array<CellCoord, MAX_BOARD_SIZE * MAX_BOARD_SIZE> CELL_COORDS = [] {
+        std::array<CellCoord, MAX_BOARD_SIZE * MAX_BOARD_SIZE> coords{};
+        for (int cell = 0; cell < MAX_BOARD_SIZE * MAX_BOARD_SIZE; ++cell)
+            coords[cell] = {static_cast<uint8_t>(cell % MAX_BOARD_SIZE), static_cast<uint8_t>(cell / MAX_BOARD_SIZE)};
+        return coords;
+    }();
+
   public:
     BitBoard(int size = 19);
 
-    static void initMasks();
-    void applyMask(const uint64_t maskArray[NUM_SEGMENTS]);
+    void applyMask(const SegmentMask &mask);
 
     // Core operations (with bounds checking)
     void setBit(int x, int y);
@@ -61,9 +87,51 @@ class BitBoard {
     BitBoard dilate() const;
     BitBoard dilate1_5() const; // Dilate by 1.5 steps
     BitBoard dilate2() const;   // Dilate by 2 steps
+    // Every cell one (dx, dy) step away from a set bit, over the first n offsets
+    // (|dx|, |dy| <= 2). Unlike dilate(), the set bits themselves are not included.
+    BitBoard dilateBy(const int (*offsets)[2], int n) const;
     BitBoard shiftFixed(int count) const;
     void orShifted(int count, const BitBoard &source);
 
+    // One step along a line: bit (x, y) of the result is bit (x + dx, y + dy) of
+    // this board, for DX, DY in {-1, 0, 1}. Steps off the board read as empty and
+    // never wrap to the adjacent row, so results can be chained (shift-and).
+    // Compile-time direction: the step is under one word, so each output word is
+    // two shifts of adjacent input words with no carry loop.
+    template <int DX, int DY> BitBoard shiftToward() const {
+        static_assert(DX >= -1 && DX <= 1 && DY >= -1 && DY <= 1 && (DX || DY), "single-cell step");
+        constexpr int S = DY * MAX_BOARD_SIZE + DX; // result bit i = source bit i + S
+
+        // Drop the source column that would wrap: stepping right reads from the
+        // next column, so column 0 can never be a source, and vice versa.
+        uint64_t src[NUM_SEGMENTS];
+        for (int i = 0; i < NUM_SEGMENTS; ++i) {
+            if constexpr (DX > 0)
+                src[i] = board[i] & MASK_NOT_COL_0[i];
+            else if constexpr (DX < 0)
+                src[i] = board[i] & MASK_NOT_COL_18[i];
+            else
+                src[i] = board[i];
+        }
+
+        BitBoard res(boardSize);
+        for (int i = 0; i < NUM_SEGMENTS; ++i) {
+            if constexpr (S > 0)
+                res.board[i] = (src[i] >> S) | (i + 1 < NUM_SEGMENTS ? src[i + 1] << (64 - S) : 0);
+            else if constexpr (S < 0)
+                res.board[i] = (src[i] << -S) | (i > 0 ? src[i - 1] >> (64 + S) : 0);
+        }
+        return res;
+    }
+
+    // Number of set bits
+    int count() const {
+        int n = 0;
+        for (int seg = 0; seg < NUM_SEGMENTS; ++seg)
+            n += __builtin_popcountll(board[seg]);
+        return n;
+    }
+
     // Iterate over all set bit indices without allocation
     template <typename F> void forEachSetBit(F &&func) const {
         for (int seg = 0; seg < NUM_SEGMENTS; ++seg) {
@@ -81,23 +149,36 @@ class BitBoard {
     template <typename T = std::pair<int, int>> std::vector<T> getSetPositions() const;
 };
 
+inline constexpr BitBoard::SegmentMask BitBoard::MASK_NOT_COL_0 = columnsExcluded(0, 0);
+inline constexpr BitBoard::SegmentMask BitBoard::MASK_NOT_COL_18 = columnsExcluded(18, 18);
+inline constexpr BitBoard::SegmentMask BitBoard::MASK_NOT_COL_0_1 = columnsExcluded(0, 1);
+inline constexpr BitBoard::SegmentMask BitBoard::MASK_NOT_COL_17_18 = columnsExcluded(17, 18);
+
 // In BitBoard.hpp after the class definition:
 template <typename T> std::vector<T> BitBoard::getSetPositions() const {
     std::vector<T> positions;
+    positions.reserve(count());
+    const int totalCells = boardSize * boardSize;
+    const bool fullSize = boardSize == MAX_BOARD_SIZE;
 
     for (int seg = 0; seg < NUM_SEGMENTS; ++seg) {
         uint64_t word = board[seg];
+        const int base = seg * BITS_PER_UINT64;
 
-        while (word) {
-            int bit_pos = __builtin_ctzll(word);
-            int global_pos = seg * BITS_PER_UINT64 + bit_pos;
-            int y = global_pos / boardSize;
-            int x = global_pos % boardSize;
+        // Only the segment holding the last cell can carry bits past the board
+        // (shifted in by the dilations): mask them off once per word instead of
+        // bounds-checking every set bit.
+        if (base + BITS_PER_UINT64 > totalCells)
+            word &= (base >= totalCells) ? 0 : (~0ULL >> (base + BITS_PER_UINT64 - totalCells));
 
-            if (x < boardSize && y < boardSize) {
-                positions.push_back({x, y});
+        while (word) {
+            int global_pos = base + __builtin_ctzll(word);
+            if (fullSize) {
+                const CellCoord c = CELL_COORDS[global_pos];
+                positions.push_back({c.x, c.y});
+            } else {
+                positions.push_back({global_pos % boardSize, global_pos / boardSize});
             }
-
             word &= word - 1;
         }
     }
@@ -7,7 +7,10 @@
 #include <utility>
 #include <vector>
 
-// Abstract interface for position evaluation
+// Abstract interface for position evaluation.
+// Concrete evaluators are `final`: their own evaluate() → evaluatePolicy()/
+// evaluateValue() calls, and any call made through the concrete type, are
+// resolved statically instead of through the vtable.
 class Evaluator {
   public:
     virtual ~Evaluator() = default;
@@ -36,7 +39,7 @@ class Evaluator {
 };
 
 // Baseline - uniform policy, rollout for value
-class UniformEvaluator : public Evaluator {
+class UniformEvaluator final : public Evaluator {
   public:
     UniformEvaluator() = default;
     ~UniformEvaluator() override = default;
@@ -46,7 +49,7 @@ class UniformEvaluator : public Evaluator {
 };
 
 // Heuristic Evaluator
-class HeuristicEvaluator : public Evaluator {
+class HeuristicEvaluator final : public Evaluator {
   public:
     HeuristicEvaluator() = default;
     ~HeuristicEvaluator() override = default;
@@ -57,7 +60,7 @@ class HeuristicEvaluator : public Evaluator {
 
 #ifdef WITH_TORCH
 #include <torch/torch.h>
-class NNEvaluator : public Evaluator {
+class NNEvaluator final : public Evaluator {
   public:
     NNEvaluator();  // randomly initialized weights (iteration 0)
     explicit NNEvaluator(const std::string &modelPath);
@@ -68,6 +71,11 @@ class NNEvaluator : public Evaluator {
 
     static std::pair<torch::Tensor, torch::Tensor> gameToTensors(const PenteGame &game);
 
+    // Position cache size in entries (rounded up to a power of two); 0 disables
+    // it. Defaults to NN_CACHE_ENTRIES, which is off when unset. Drops any cached
+    // results, so call it before a search, not during one.
+    void setCacheCapacity(size_t entries);
+
     std::vector<std::pair<std::vector<std::pair<PenteGame::Move, float>>, float>>
         evaluateBatch(const std::vector<PenteGame> &games) override;
 
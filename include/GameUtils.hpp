@@ -42,6 +42,12 @@ class GameUtils {
     // Read NUM_THREADS from env var or .env file; aborts if unset or invalid.
     static int numThreadsFromEnv();
 
+    // Read NN_FP16 from env var or .env file; true for "1", false if unset.
+    static bool nnHalfPrecisionFromEnv();
+
+    // Read NN_CACHE_ENTRIES from env var or .env file; 0 (cache off) if unset or invalid.
+    static size_t nnCacheEntriesFromEnv();
+
     // PUCT exploration constant, scaled down as the game progresses: a wide-open
     // early/tactical position needs more exploitation-focused search to
     // concentrate a limited sim budget on forcing lines, vs. a settled late-game
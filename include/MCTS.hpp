@@ -50,46 +50,41 @@ class MCTS {
         Config() : explorationConstant(std::sqrt(2.0)) {}
     };
 
-    // Node in the MCTS tree - trivially destructible, ~64 bytes
-    // All dynamic arrays are arena-allocated via raw pointers
+    // Node in the MCTS tree - trivially destructible, 72 bytes
+    // All dynamic arrays are arena-allocated via raw pointers.
+    // Fields are ordered widest-first so the compiler inserts no interior padding;
+    // the previous declaration order padded the node out to 88 bytes.
     struct Node {
-        // Move that led to this node (4 bytes)
-        PenteGame::Move move;
-
-        // Player who made the move (1 byte, uint8_t-backed enum)
-        PenteGame::Player player;
-
-        // Minimax proof status (1 byte)
-        SolvedStatus solvedStatus = SolvedStatus::UNSOLVED;
-
-        // hash
+        // 8-byte fields (40 bytes)
         uint64_t positionHash = 0;
-
-        // Child array metadata (2 bytes each = 4 bytes)
-        uint16_t childCount = 0;
-        uint16_t childCapacity = 0;
-
-        // Untried moves metadata (2 bytes each = 4 bytes)
-        uint16_t unprovenCount = 0;
-
-        // Statistics (16 bytes)
-        int32_t visits = 0;
-        int32_t wins = 0;
         double totalValue = 0.0;
-
         // moves and priors share the same size, and are accessed together
         PenteGame::Move *moves;
         float *priors;
+        Node **children = nullptr; // Arena-allocated array of child pointers
+
+        // 4-byte fields (16 bytes)
+        int32_t visits = 0;
+        int32_t wins = 0;
         float value = 0.0f;
         int nextPriorIdx = 0;      // Index of next prior to explore for selection (used in PUCT)
-        int8_t canonicalSym = -1;  // -1 = moves[] in physical coords; 0-7 = moves[] in canonical coords
 
-        // Pointers (24 bytes)
-        Node **children = nullptr; // Arena-allocated array of child pointers
+        // Child array / untried moves metadata (6 bytes)
+        uint16_t childCount = 0;
+        uint16_t childCapacity = 0;
+        uint16_t unprovenCount = 0;
+
+        // Move that led to this node (2 bytes)
+        PenteGame::Move move;
+
+        // 1-byte fields (5 bytes)
+        PenteGame::Player player;                           // Player who made the move
+        SolvedStatus solvedStatus = SolvedStatus::UNSOLVED; // Minimax proof status
+        int8_t canonicalSym = -1;  // -1 = moves[] in physical coords; 0-7 = moves[] in canonical coords
         bool expanded = false;
         bool evaluated = false;
 
-        // Total: 4 + 1 + 1 + 4 + 4 + 16 + 24 = 54 bytes + padding = 56-64 bytes
+        // Total: 40 + 16 + 6 + 2 + 5 = 69 bytes + tail padding = 72 bytes
 
         bool isFullyExpanded() const { return expanded; }                          // HMM
         bool isTerminal() const { return solvedStatus != SolvedStatus::UNSOLVED; } // HMM
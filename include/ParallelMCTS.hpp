@@ -5,6 +5,7 @@
 #include "Evaluator.hpp"
 #include "PenteGame.hpp"
 #include <atomic>
+#include <chrono>
 #include <condition_variable>
 #include <cmath>
 #include <cstdlib>
@@ -69,10 +70,14 @@ class ParallelMCTS {
         std::atomic<int32_t> virtualLosses{0};
         std::atomic<bool> expanded{false};
         std::atomic<bool> evaluated{false};
+        // Rarely written, but read for every child in every PUCT scan next to
+        // the counters above: keeping it on this line means selection touches
+        // one cache line per child instead of two.
+        std::atomic<SolvedStatus> solvedStatus{SolvedStatus::UNSOLVED};
 
         // ---- Lock (cache line 1): contended only during node expansion ----
         // alignas(64) inserts implicit padding between the hot atomics above
-        // (~22 bytes) and the mutex so they never share a cache line.
+        // (~23 bytes) and the mutex so they never share a cache line.
         alignas(64) mutable std::mutex nodeSubtreeLock;
 
         // ---- Cold section (cache line 2+): immutable after creation ----
@@ -80,7 +85,6 @@ class ParallelMCTS {
         // platform size) so cold reads never invalidate hot write cache lines.
         alignas(64) PenteGame::Move move;
         PenteGame::Player player;
-        std::atomic<SolvedStatus> solvedStatus{SolvedStatus::UNSOLVED};
         uint64_t positionHash = 0;
         uint16_t childCount = 0;
         uint16_t childCapacity = 0;
@@ -109,20 +113,29 @@ class ParallelMCTS {
         std::vector<ThreadSafeNode *> searchPath;
     };
 
-    // Virtual loss manager - tracks virtual losses on nodes during search
+    // Virtual loss manager - tracks virtual losses on nodes during search.
+    // Stateless: the counts live in each node's atomic virtualLosses, so these
+    // are defined inline for the PUCT loop, which reads every child once per step.
     class VirtualLossManager {
       public:
         // Add virtual loss when a node is selected in parallel
-        void addVirtualLoss(ThreadSafeNode *node, int32_t amount = 1);
+        void addVirtualLoss(ThreadSafeNode *node, int32_t amount = 1) {
+            if (!node) return;
+            node->virtualLosses.fetch_add(amount, std::memory_order_relaxed);
+        }
 
         // Remove virtual loss after backpropagation
-        void removeVirtualLoss(ThreadSafeNode *node, int32_t amount = 1);
+        void removeVirtualLoss(ThreadSafeNode *node, int32_t amount = 1) {
+            if (!node) return;
+            node->virtualLosses.fetch_sub(amount, std::memory_order_relaxed);
+        }
 
         // Get effective visit count (accounting for virtual losses)
-        int32_t getEffectiveVisits(ThreadSafeNode *node) const;
-
-      private:
-        mutable std::mutex statsLock;
+        int32_t getEffectiveVisits(const ThreadSafeNode *node) const {
+            if (!node) return 0;
+            return node->visits.load(std::memory_order_relaxed) +
+                   node->virtualLosses.load(std::memory_order_relaxed);
+        }
     };
 
     // Thread-safe queue for evaluation requests
@@ -132,18 +145,35 @@ class ParallelMCTS {
 
         // Try to push evaluation request (non-blocking)
         bool tryPush(const EvaluationRequest &request);
+        bool tryPush(ThreadSafeNode *node, const PenteGame &gameState,
+                     const std::vector<ThreadSafeNode *> &searchPath);
 
         // Pop a batch of evaluation requests for NN evaluation
         std::vector<EvaluationRequest> popBatch(size_t batchSize);
 
+        // Like popBatch, but blocks until a request arrives or the timeout elapses
+        std::vector<EvaluationRequest> waitPopBatch(size_t batchSize, std::chrono::milliseconds timeout);
+
         // Check if queue has items
         bool empty() const;
 
         size_t size() const;
 
       private:
+        // Pops up to batchSize requests; caller must hold queueLock.
+        std::vector<EvaluationRequest> takeLocked(size_t batchSize);
+
+        // Fixed-capacity ring of request slots. A request embeds a full PenteGame
+        // (~6 KB, ~5 KB of it the rng), so a std::deque here allocated one block
+        // per push; the ring grows lazily up to capacity and then recycles its
+        // slots instead. Popping moves the game's move vector and the search path
+        // out to the consumer, so refilling a slot still allocates those two small
+        // vectors — only the per-request block is saved.
         mutable std::mutex queueLock;
-        std::deque<EvaluationRequest> queue;
+        std::condition_variable notEmpty;
+        std::vector<EvaluationRequest> slots;
+        size_t head = 0;   // index of the oldest pending request
+        size_t count = 0;  // number of pending requests
         size_t capacity;
     };
 
@@ -153,9 +183,15 @@ class ParallelMCTS {
         // Push evaluation result for backpropagation
         void push(const EvaluationResult &result);
 
+        // Push a whole evaluated batch under a single lock acquisition
+        void pushBatch(std::vector<EvaluationResult> &&results);
+
         // Pop one result (non-blocking); returns nullopt if queue is empty
         std::optional<EvaluationResult> tryPop();
 
+        // Pop up to maxCount results (non-blocking) under a single lock acquisition
+        std::vector<EvaluationResult> tryPopBatch(size_t maxCount);
+
         // Pop all pending backpropagation results
         std::vector<EvaluationResult> popAll();
 
@@ -269,6 +305,7 @@ class ParallelMCTS {
     // Helper methods
     int selectBestMoveIndex(ThreadSafeNode *node, const PenteGame &game) const;
     void injectDirichletNoise();
+    void proveImmediateRootWin(const PenteGame &game);
 
     // Arena allocation
     ThreadSafeNode *allocateNode();
@@ -307,7 +344,7 @@ class ParallelMCTS {
     // Member variables
     Config config_;
     std::unique_ptr<Arena> arena_;
-    std::unique_ptr<VirtualLossManager> virtualLossManager_;
+    VirtualLossManager virtualLossManager_;
     std::unique_ptr<EvaluationQueue> evaluationQueue_;
     std::unique_ptr<BackpropagationQueue> backpropagationQueue_;
     std::unique_ptr<WorkerPool> workerPool_;
@@ -333,6 +370,9 @@ class ParallelMCTS {
     // Populated by setupSlabs() at the start of search(); cleared by reset().
     std::vector<SlabView> workerSlabs_;
 
+    // Max backprop results a worker takes per Phase 2 pass.
+    static constexpr size_t kBackpropDrainBatch = 8;
+
     // Size of each on-demand refill chunk when a slab runs out.
     static constexpr size_t kSlabRefillBytes = 16 * 1024 * 1024;  // 16 MB
 };
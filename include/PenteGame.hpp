@@ -49,6 +49,9 @@ class PenteGame {
     Config config_;
     BitBoard blackStones;
     BitBoard whiteStones;
+    // blackStones | whiteStones, kept in step by makeMove() and captures so the
+    // emptiness tests on the move-generation path read one board instead of two
+    BitBoard occupiedStones;
     Player currentPlayer;
     int blackCaptures;
     int whiteCaptures;
@@ -67,18 +70,25 @@ class PenteGame {
     // std::vector<MoveInfo> moveHistory;
 
     Move lastMove;
+    // Result of computeWinner() for the current position, refreshed by makeMove():
+    // the rollout loop and the searches ask for the winner several times per
+    // position, while the position changes only there.
+    Player winner_ = NONE;
     uint64_t hash_;
     mutable std::mt19937 rng_;
 
     // Helper functions
     bool checkFiveInRow(int x, int y) const;
+    Player computeWinner() const;
     int checkAndCapture(int x, int y);
-    int countConsecutive(const BitBoard &stones, int x, int y, int dx, int dy) const;
 
     std::vector<Move> promisingMovesVector;                     // empty squares within distance 1 of any stone
     mutable std::vector<Move> tournamentRulePerimeterBuffer;    // filtered perimeter for move 3 rule
-    std::array<size_t, BOARD_SIZE * BOARD_SIZE> promisingMoveIndex;
-    static constexpr size_t INVALID_INDEX = static_cast<size_t>(-1); // Max size_t value
+    // Position -> slot in promisingMovesVector. Slots are < 361, so uint16_t is
+    // enough; at 722 bytes instead of 2.9 KB this keeps every clone()/syncFrom()
+    // (once per simulation, once per queued eval request) noticeably smaller.
+    std::array<uint16_t, BOARD_SIZE * BOARD_SIZE> promisingMoveIndex;
+    static constexpr uint16_t INVALID_INDEX = UINT16_MAX;
 
     size_t encodePos(int x, int y) const { return static_cast<size_t>(y * BOARD_SIZE + x); }
 
@@ -91,7 +101,7 @@ class PenteGame {
         size_t pos = encodePos(x, y);
         if (promisingMoveIndex[pos] == INVALID_INDEX) {
             promisingMovesVector.emplace_back(x, y);
-            promisingMoveIndex[pos] = promisingMovesVector.size() - 1;
+            promisingMoveIndex[pos] = static_cast<uint16_t>(promisingMovesVector.size() - 1);
         }
     }
 
@@ -106,21 +116,24 @@ class PenteGame {
             if (promisingIdx != lastPromisingIdx) {
                 Move lastMove = promisingMovesVector.back();
                 promisingMovesVector[promisingIdx] = lastMove;
-                promisingMoveIndex[encodePos(lastMove.x, lastMove.y)] = promisingIdx;
+                promisingMoveIndex[encodePos(lastMove.x, lastMove.y)] = static_cast<uint16_t>(promisingIdx);
             }
             promisingMovesVector.pop_back();
             promisingMoveIndex[pos] = INVALID_INDEX;
         }
 
-        // Handle offsets
-        for (int i = 0; i < config_.numOffsets; i++) {
+        // Handle offsets. The bounds and offset count are read into locals first:
+        // emplace_back() below writes through a pointer, so without this the
+        // compiler reloads config_ on every iteration of this per-move loop.
+        const int lo = minIdx(), hi = maxIdx(), numOffsets = config_.numOffsets;
+        for (int i = 0; i < numOffsets; i++) {
             int nx = x + dirs[i][0], ny = y + dirs[i][1];
-            if (nx >= minIdx() && nx < maxIdx() && ny >= minIdx() && ny < maxIdx()) {
-                if (!blackStones.getBitUnchecked(nx, ny) && !whiteStones.getBitUnchecked(nx, ny)) {
+            if (nx >= lo && nx < hi && ny >= lo && ny < hi) {
+                if (!occupiedStones.getBitUnchecked(nx, ny)) {
                     size_t npos = encodePos(nx, ny);
                     if (promisingMoveIndex[npos] == INVALID_INDEX) {
                         promisingMovesVector.emplace_back(nx, ny);
-                        promisingMoveIndex[npos] = promisingMovesVector.size() - 1;
+                        promisingMoveIndex[npos] = static_cast<uint16_t>(promisingMovesVector.size() - 1);
                     }
                 }
             }
@@ -153,8 +166,7 @@ class PenteGame {
         tournamentRulePerimeterBuffer.reserve(allPerimeterMoves.size());
 
         for (const Move &move : allPerimeterMoves) {
-            if (!blackStones.getBitUnchecked(move.x, move.y) &&
-                !whiteStones.getBitUnchecked(move.x, move.y)) {
+            if (!occupiedStones.getBitUnchecked(move.x, move.y)) {
                 tournamentRulePerimeterBuffer.push_back(move);
             }
         }
@@ -164,6 +176,32 @@ class PenteGame {
 
     void patchPromisingMovesAfterCaptures(const BitBoard &capturedBits);
 
+    // One byte per cell copy of the board for the move heuristic, padded so that
+    // evaluateMove's furthest probe (5 cells past the move) stays inside the array:
+    // lookups need no bounds checks, and a run scan stops at WALL like at any
+    // non-matching cell. Stones are stored as their Player value.
+    struct CellMap {
+        static constexpr int PAD = 6;
+        static constexpr int WIDTH = BOARD_SIZE + 2 * PAD;
+        static constexpr uint8_t WALL = 3;
+        std::array<uint8_t, WIDTH * WIDTH> cells;
+        uint8_t at(int x, int y) const { return cells[(y + PAD) * WIDTH + x + PAD]; }
+    };
+    void fillCellMap(CellMap &map) const;
+    // The same at() lookup straight off the bitboards, bounds-checked: a single
+    // evaluateMove reads a few dozen cells, less than filling a CellMap costs.
+    struct StoneCells {
+        const BitBoard &black;
+        const BitBoard &white;
+        uint8_t at(int x, int y) const {
+            if (x < 0 || x >= BOARD_SIZE || y < 0 || y >= BOARD_SIZE)
+                return CellMap::WALL;
+            return black.getBitUnchecked(x, y) ? BLACK : white.getBitUnchecked(x, y) ? WHITE : NONE;
+        }
+    };
+    // Move heuristic over either cell source; defined and instantiated in PenteGame.cpp.
+    template <typename Cells> float scoreMove(Move move, const Cells &cells) const;
+
   public:
     PenteGame(const Config &config = Config::pente());
 
@@ -175,7 +213,7 @@ class PenteGame {
 
     // Game state queries
     Player getCurrentPlayer() const { return currentPlayer; }
-    Player getWinner() const;
+    Player getWinner() const { return winner_; }
     bool isGameOver() const;
     bool isLegalMove(int x, int y) const;
     const std::vector<Move> &getLegalMoves() const;
@@ -194,6 +232,9 @@ class PenteGame {
     Move getRandomPromisingMove() const;
     PenteGame clone() const;
     void syncFrom(const PenteGame &other);
+    // syncFrom() plus other's rng state, so random play continues exactly as it
+    // would in a copy of other (reproducible from Config::seed).
+    void syncFromWithRng(const PenteGame &other);
     uint64_t computeHash() const;
     uint64_t getHash() const;
     uint64_t getCanonicalHash(int &outSym) const;
@@ -204,6 +245,9 @@ class PenteGame {
 
     // Heuristic evaluation
     float evaluateMove(Move move) const;
+    // Same scores as evaluateMove for each move, building the cell map once for
+    // the whole batch instead of probing the bitboards with bounds checks per move.
+    void evaluateMoves(const std::vector<Move> &moves, std::vector<float> &scores) const;
     float evaluatePosition() const;
     int countOpenFours(Player player) const;
 
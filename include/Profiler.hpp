@@ -18,6 +18,7 @@
 #include <mutex>
 #include <string>
 #include <unordered_map>
+#include <unordered_set>
 #include <vector>
 
 // ============================================================================
@@ -37,8 +38,19 @@ class Profiler {
         return profiler;
     }
 
-    // Record a timing measurement for a section
-    void record(const std::string &section, double durationNs) {
+    // Canonical pointer for a section name: equal names map to the same pointer
+    // even when the compiler keeps separate copies of a literal (e.g. a
+    // PROFILE_SCOPE in an inline header function, instantiated per translation
+    // unit). PROFILE_SCOPE calls this once per call site.
+    const char *intern(const char *name) {
+        std::lock_guard<std::mutex> lock(mutex_);
+        return names_.emplace(name).first->c_str();
+    }
+
+    // Record a timing measurement for a section. Sections are keyed by their
+    // interned name pointer, so recording never builds or hashes a string on
+    // the hot path.
+    void record(const char *section, double durationNs) {
         std::lock_guard<std::mutex> lock(mutex_);
         auto &stats = sections_[section];
         stats.callCount++;
@@ -62,7 +74,7 @@ class Profiler {
         }
 
         // Collect and sort by total time (descending)
-        std::vector<std::pair<std::string, SectionStats>> sorted(sections_.begin(), sections_.end());
+        std::vector<std::pair<const char *, SectionStats>> sorted(sections_.begin(), sections_.end());
         std::sort(sorted.begin(), sorted.end(),
                   [](const auto &a, const auto &b) { return a.second.totalTimeNs > b.second.totalTimeNs; });
 
@@ -111,7 +123,8 @@ class Profiler {
     Profiler &operator=(const Profiler &) = delete;
 
     mutable std::mutex mutex_;
-    std::unordered_map<std::string, SectionStats> sections_;
+    std::unordered_map<const char *, SectionStats> sections_;
+    std::unordered_set<std::string> names_;  // node-based: interned c_str()s stay valid
 };
 
 // ============================================================================
@@ -120,11 +133,11 @@ class Profiler {
 
 class ScopedTimer {
   public:
-    explicit ScopedTimer(const std::string &section)
-        : section_(section), start_(std::chrono::high_resolution_clock::now()) {}
+    explicit ScopedTimer(const char *section)
+        : section_(section), start_(std::chrono::steady_clock::now()) {}
 
     ~ScopedTimer() {
-        auto end = std::chrono::high_resolution_clock::now();
+        auto end = std::chrono::steady_clock::now();
         auto durationNs = std::chrono::duration<double, std::nano>(end - start_).count();
         Profiler::instance().record(section_, durationNs);
     }
@@ -134,16 +147,22 @@ class ScopedTimer {
     ScopedTimer &operator=(const ScopedTimer &) = delete;
 
   private:
-    std::string section_;
-    std::chrono::high_resolution_clock::time_point start_;
+    const char *section_;
+    std::chrono::steady_clock::time_point start_;
 };
 
 // ============================================================================
 // Macros - Active when profiling enabled
 // ============================================================================
 
-#define PROFILE_FUNCTION() ScopedTimer _profiler_timer_(__func__)
-#define PROFILE_SCOPE(name) ScopedTimer _profiler_timer_##__LINE__(name)
+#define PROFILE_CONCAT_(a, b) a##b
+#define PROFILE_CONCAT(a, b) PROFILE_CONCAT_(a, b)
+#define PROFILE_SCOPE_AS_(name, id)                                                                            \
+    static const char *const PROFILE_CONCAT(id, _name) = Profiler::instance().intern(name);                 \
+    ScopedTimer id(PROFILE_CONCAT(id, _name))
+
+#define PROFILE_FUNCTION() PROFILE_SCOPE(__func__)
+#define PROFILE_SCOPE(name) PROFILE_SCOPE_AS_(name, PROFILE_CONCAT(_profiler_timer_, __LINE__))
 
 #else // ENABLE_PROFILING not defined
 
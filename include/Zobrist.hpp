@@ -44,8 +44,10 @@ class Zobrist {
     int symMap[8][BOARD_CELLS];
     int inverseSym[8]; // D4 group inverses: {0,3,2,1,4,5,6,7}
 
-    // Optional micro-opt: symStoneKeys[sym][player][cell] = stoneKeys[player][ symMap[sym][cell] ]
-    uint64_t symStoneKeys[8][2][BOARD_CELLS];
+    // Optional micro-opt: symStoneKeys[player][cell][sym] = stoneKeys[player][ symMap[sym][cell] ]
+    // Symmetry innermost: a stone's 8 keys fill exactly one cache line, so
+    // computeCanonicalHash reads one line per stone instead of eight scattered ones.
+    alignas(64) uint64_t symStoneKeys[2][BOARD_CELLS][8];
 
     Zobrist() {
         std::mt19937_64 rng(0xDEADBEEFCAFEBABEULL);
@@ -123,12 +125,12 @@ class Zobrist {
             }
         }
 
-        // Precompose keys for speed: symStoneKeys[sym][p][cell] is the key to XOR for a stone at 'cell'
+        // Precompose keys for speed: symStoneKeys[p][cell][sym] is the key to XOR for a stone at 'cell'
         // under symmetry 'sym'.
         for (int sym = 0; sym < 8; ++sym) {
             for (int p = 0; p < 2; ++p) {
                 for (int cell = 0; cell < BOARD_CELLS; ++cell) {
-                    symStoneKeys[sym][p][cell] = stoneKeys[p][symMap[sym][cell]];
+                    symStoneKeys[p][cell][sym] = stoneKeys[p][symMap[sym][cell]];
                 }
             }
         }
@@ -13,8 +13,8 @@ void BitBoard::setBit(int x, int y) {
     }
 
     int index = toIndex(x, y);
-    int segment = index / BITS_PER_UINT64;
-    int bit = index % BITS_PER_UINT64;
+    int segment = index >> 6;
+    int bit = index & 63;
 
     board[segment] |= (1ULL << bit);
 }
@@ -26,8 +26,8 @@ void BitBoard::clearBit(int x, int y) {
     }
 
     int index = toIndex(x, y);
-    int segment = index / BITS_PER_UINT64;
-    int bit = index % BITS_PER_UINT64;
+    int segment = index >> 6;
+    int bit = index & 63;
 
     board[segment] &= ~(1ULL << bit);
 }
@@ -39,8 +39,8 @@ bool BitBoard::getBit(int x, int y) const {
     }
 
     int index = toIndex(x, y);
-    int segment = index / BITS_PER_UINT64;
-    int bit = index % BITS_PER_UINT64;
+    int segment = index >> 6;
+    int bit = index & 63;
 
     return (board[segment] >> bit) & 1;
 }
@@ -81,72 +81,15 @@ BitBoard BitBoard::operator~() const {
     return result;
 }
 
-uint64_t BitBoard::MASK_NOT_COL_0[NUM_SEGMENTS] = {0};
-uint64_t BitBoard::MASK_NOT_COL_18[NUM_SEGMENTS] = {0};
-uint64_t BitBoard::MASK_NOT_COL_0_1[NUM_SEGMENTS] = {0};
-uint64_t BitBoard::MASK_NOT_COL_17_18[NUM_SEGMENTS] = {0};
-bool BitBoard::masksInitialized = false;
-
-void BitBoard::initMasks() {
-    if (masksInitialized)
-        return;
-
-    // 1. Initialize ALL masks to all-ones (0xFFFFFFFFFFFFFFFF)
-    for (int i = 0; i < NUM_SEGMENTS; i++) {
-        MASK_NOT_COL_0[i] = ~0ULL;
-        MASK_NOT_COL_18[i] = ~0ULL;
-        MASK_NOT_COL_0_1[i] = ~0ULL;   // Added this
-        MASK_NOT_COL_17_18[i] = ~0ULL; // Added this
-    }
-
-    // 2. Punch out the prohibited columns
-    for (int y = 0; y < 19; y++) {
-        // Distance 1 columns
-        int i0 = y * 19 + 0;
-        MASK_NOT_COL_0[i0 / 64] &= ~(1ULL << (i0 % 64));
-
-        int i18 = y * 19 + 18;
-        MASK_NOT_COL_18[i18 / 64] &= ~(1ULL << (i18 % 64));
-
-        // Distance 2 columns
-        for (int x : {0, 1}) {
-            int idx = y * 19 + x;
-            MASK_NOT_COL_0_1[idx / 64] &= ~(1ULL << (idx % 64));
-        }
-        for (int x : {17, 18}) {
-            int idx = y * 19 + x;
-            MASK_NOT_COL_17_18[idx / 64] &= ~(1ULL << (idx % 64));
-        }
-    }
-
-    // Handle the "Dead Bits" (Bits 361-383 in the 6th segment)
-    // This prevents ~occupied from suggesting moves outside the 19x19 grid
-    int totalBits = 19 * 19;
-    int lastSegment = totalBits / 64;
-    int remainingBits = totalBits % 64;
-    uint64_t validBitsMask = (1ULL << remainingBits) - 1;
-
-    // Apply this to all masks to keep the "junk" area clean
-    MASK_NOT_COL_0[lastSegment] &= validBitsMask;
-    MASK_NOT_COL_18[lastSegment] &= validBitsMask;
-    MASK_NOT_COL_0_1[lastSegment] &= validBitsMask;
-    MASK_NOT_COL_17_18[lastSegment] &= validBitsMask;
-
-    masksInitialized = true;
-}
-
 // In BitBoard.cpp
-void BitBoard::applyMask(const uint64_t maskArray[NUM_SEGMENTS]) {
+void BitBoard::applyMask(const SegmentMask &mask) {
     for (int i = 0; i < NUM_SEGMENTS; ++i) {
-        board[i] &= maskArray[i];
+        board[i] &= mask[i];
     }
 }
 
 // Logic for Dilate (Distance 1)
 BitBoard BitBoard::dilate() const {
-    if (!masksInitialized)
-        initMasks();
-
     BitBoard res = *this;
 
     // Vertical (No masking needed because there is no 'wrap' at top/bottom)
@@ -217,9 +160,6 @@ void BitBoard::orShifted(int count, const BitBoard &source) {
 }
 
 BitBoard BitBoard::dilate1_5() const {
-    if (!masksInitialized)
-        initMasks();
-
     // Start with Distance 1
     BitBoard res = this->dilate();
 
@@ -322,6 +262,23 @@ BitBoard BitBoard::dilate2() const {
     return res;
 }
 
+BitBoard BitBoard::dilateBy(const int (*offsets)[2], int n) const {
+    // Column-masked sources indexed by dx + 2, so a sideways step never wraps
+    // into the neighbouring row
+    BitBoard src[5] = {*this, *this, *this, *this, *this};
+    src[0].applyMask(MASK_NOT_COL_0_1);
+    src[1].applyMask(MASK_NOT_COL_0);
+    src[3].applyMask(MASK_NOT_COL_18);
+    src[4].applyMask(MASK_NOT_COL_17_18);
+
+    BitBoard res(boardSize);
+    for (int i = 0; i < n; ++i) {
+        int dx = offsets[i][0], dy = offsets[i][1];
+        res.orShifted(dy * MAX_BOARD_SIZE + dx, src[dx + 2]);
+    }
+    return res;
+}
+
 BitBoard BitBoard::shiftFixed(int count) const {
     BitBoard res(boardSize);
     if (count > 0) {                // Shift "Forward" (Right/Down)
@@ -13,7 +13,12 @@
 // ============================================================================
 float Evaluator::rollout(const PenteGame &game) {
     PROFILE_SCOPE("Evaluator::rollout");
-    PenteGame simGame = game;
+    // Per-thread scratch game, refilled instead of copy-constructed so its move
+    // vector keeps its capacity across rollouts. The rng comes from `game`, as a
+    // copy would: the rollout is reproducible from the game's seed, whatever
+    // other games this thread has rolled out before.
+    thread_local PenteGame simGame(game.getConfig());
+    simGame.syncFromWithRng(game);
     PenteGame::Player startPlayer = simGame.getCurrentPlayer();
     PenteGame::Player winner = PenteGame::NONE;
     int depth = 0;
@@ -45,7 +50,7 @@ Evaluator::evaluateBatch(const std::vector<PenteGame> &games) {
 std::pair<std::vector<std::pair<PenteGame::Move, float>>, float> UniformEvaluator::evaluate(const PenteGame &game) {
     auto policy = evaluatePolicy(game);
     float value = evaluateValue(game);
-    return {policy, value};
+    return {std::move(policy), value};
 }
 
 std::vector<std::pair<PenteGame::Move, float>> UniformEvaluator::evaluatePolicy(const PenteGame &game) {
@@ -100,7 +105,7 @@ float UniformEvaluator::evaluateValue(const PenteGame &game) { return rollout(ga
 std::pair<std::vector<std::pair<PenteGame::Move, float>>, float> HeuristicEvaluator::evaluate(const PenteGame &game) {
     auto policy = evaluatePolicy(game);
     float value = evaluateValue(game);
-    return {policy, value};
+    return {std::move(policy), value};
 }
 
 std::vector<std::pair<PenteGame::Move, float>> HeuristicEvaluator::evaluatePolicy(const PenteGame &game) {
@@ -119,9 +124,17 @@ std::vector<std::pair<PenteGame::Move, float>> HeuristicEvaluator::evaluatePolic
     // Loop-invariant: doesn't depend on the candidate move, hoist out of the loop below.
     bool tournamentThirdMove = (game.getMoveCount() == 2 && game.getConfig().tournamentRule);
 
+    // Score every move in one batch (one board copy for all of them) unless the
+    // tournament rule overrides the heuristic below.
+    std::vector<float> moveScores;
+    if (!tournamentThirdMove) {
+        game.evaluateMoves(legalMoves, moveScores);
+    }
+
     float totalScore = 0.0f;
     // evaluateMove uses promising moves to skip over bad moves
-    for (const auto &move : legalMoves) {
+    for (size_t i = 0; i < legalMoves.size(); i++) {
+        const auto &move = legalMoves[i];
         float score;
         // if tournament rule and game move num is 3 and move is in the restricted area score is 0, otherwise evaluate normally.
         // TODO selection needs to account for tournament rule
@@ -134,7 +147,7 @@ std::vector<std::pair<PenteGame::Move, float>> HeuristicEvaluator::evaluatePolic
                 score = 0.0f;
             }
         } else {
-            score = game.evaluateMove(move);
+            score = moveScores[i];
         }
         policyScores.emplace_back(move, score);
         totalScore += score;
@@ -3,6 +3,7 @@
 #include "ParallelMCTS.hpp"
 #include "PenteGame.hpp"
 #include "Profiler.hpp"
+#include <array>
 #include <chrono>
 #include <ctime>
 #include <cstdlib>
@@ -115,6 +116,26 @@ int GameUtils::numThreadsFromEnv() {
     std::exit(1);
 }
 
+bool GameUtils::nnHalfPrecisionFromEnv() {
+    const char *val = std::getenv("NN_FP16");
+    if (val && std::strlen(val) > 0) return std::atoi(val) != 0;
+    std::string buf;
+    const char *p = readKeyFromDotEnv("NN_FP16=", buf);
+    return p && std::atoi(p) != 0;
+}
+
+size_t GameUtils::nnCacheEntriesFromEnv() {
+    const char *val = std::getenv("NN_CACHE_ENTRIES");
+    if (val && std::strlen(val) > 0) {
+        long long n = std::atoll(val);
+        return n > 0 ? static_cast<size_t>(n) : 0;
+    }
+    std::string buf;
+    const char *p = readKeyFromDotEnv("NN_CACHE_ENTRIES=", buf);
+    long long n = p ? std::atoll(p) : 0;
+    return n > 0 ? static_cast<size_t>(n) : 0;
+}
+
 double GameUtils::explorationConstantForMoveCount(int moveCount) {
     return moveCount <= 10 ? 2.5 : moveCount <= 18 ? 1.8 : 1.414;
 }
@@ -174,7 +195,16 @@ std::vector<std::string> GameUtils::parseGameString(const char *gameStr) {
 }
 
 void GameUtils::printBoard(const PenteGame &game) {
-    const auto &legalMoves = game.getLegalMoves();
+    // Resolve every cell's glyph up front: mark legal moves once instead of
+    // scanning the move list for every empty cell, and place stones by scanning
+    // the set bits of each stone board instead of querying all 361 cells.
+    std::array<const char *, PenteGame::BOARD_SIZE * PenteGame::BOARD_SIZE> glyph;
+    glyph.fill("\u00B7 ");
+    for (const auto &move : game.getLegalMoves()) {
+        glyph[move.y * PenteGame::BOARD_SIZE + move.x] = "  ";
+    }
+    game.getBlackBitBoard().forEachSetBit([&](int cell) { glyph[cell] = "\u25CB "; }); // White circle for Black stones
+    game.getWhiteBitBoard().forEachSetBit([&](int cell) { glyph[cell] = "\u25CF "; }); // Black circle for White stones
 
     // Helper to handle skipping 'I'
     auto getColChar = [](int x) {
@@ -182,39 +212,30 @@ void GameUtils::printBoard(const PenteGame &game) {
         return (c >= 'I') ? (char)(c + 1) : c;
     };
 
-    std::cout << "   ";
-    for (int x = 0; x < PenteGame::BOARD_SIZE; x++) {
-        std::cout << getColChar(x) << " ";
-    }
-    std::cout << "\n";
+    // Build the whole board in one string and write it once, rather than
+    // issuing a stream insertion per cell.
+    std::string out;
+    out.reserve(4096);
+    auto appendColumnLabels = [&] {
+        out += "   ";
+        for (int x = 0; x < PenteGame::BOARD_SIZE; x++) {
+            out += getColChar(x);
+            out += ' ';
+        }
+        out += '\n';
+    };
 
+    appendColumnLabels();
     for (int y = PenteGame::BOARD_SIZE - 1; y >= 0; y--) {
-        std::cout << (y < 9 ? " " : "") << (y + 1) << " ";
+        out += (y < 9 ? " " : "") + std::to_string(y + 1) + " ";
         for (int x = 0; x < PenteGame::BOARD_SIZE; x++) {
-            PenteGame::Player stone = game.getStoneAt(x, y);
-            if (stone == PenteGame::BLACK) {
-                std::cout << "\u25CB "; // White circle for Black stones
-            } else if (stone == PenteGame::WHITE) {
-                std::cout << "\u25CF "; // Black circle for White stones
-            } else {
-                bool isLegal = false;
-                for (const auto &move : legalMoves) {
-                    if (move.x == x && move.y == y) {
-                        isLegal = true;
-                        break;
-                    }
-                }
-                std::cout << (isLegal ? "  " : "\u00B7 ");
-            }
+            out += glyph[y * PenteGame::BOARD_SIZE + x];
         }
-        std::cout << (y + 1) << "\n";
+        out += std::to_string(y + 1) + "\n";
     }
+    appendColumnLabels();
 
-    std::cout << "   ";
-    for (int x = 0; x < PenteGame::BOARD_SIZE; x++) {
-        std::cout << getColChar(x) << " ";
-    }
-    std::cout << "\n";
+    std::cout << out;
 }
 
 void GameUtils::printGameState(const PenteGame &game) {
@@ -271,15 +271,20 @@ MCTS::Node *MCTS::select(Node *node, PenteGame &game, std::vector<Node *> &searc
             int childSym = -1;
             uint64_t hash = useCanonical ? game.getCanonicalHash(childSym) : game.getHash();
 
-            auto it = nodeTranspositionTable.find(hash);
-            bool foundInTable = (it != nodeTranspositionTable.end());
-
-            if (!foundInTable) {
-                // lazy expansion
-                child = allocateNode();
+            // One hash probe for both the lookup and the insert on a miss.
+            auto [it, inserted] = nodeTranspositionTable.try_emplace(hash, nullptr);
+
+            if (inserted) {
+                // lazy expansion; don't leave a null entry behind if the arena is full
+                try {
+                    child = allocateNode();
+                } catch (const std::bad_alloc &) {
+                    nodeTranspositionTable.erase(it);
+                    throw;
+                }
                 child->move = canonMove;
                 child->player = (node->player == PenteGame::BLACK) ? PenteGame::WHITE : PenteGame::BLACK;
-                nodeTranspositionTable[hash] = child;
+                it->second = child;
             } else {
                 child = it->second;
             }
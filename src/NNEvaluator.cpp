@@ -1,32 +1,96 @@
 #ifdef WITH_TORCH
 #include "Evaluator.hpp"
+#include "GameUtils.hpp"
 #include "NNModel.hpp"
 #include <algorithm>
+#include <bit>
+#include <mutex>
+#include <optional>
 #include <stdexcept>
 #include <torch/torch.h>
+#include <vector>
+
+using EvalResult = std::pair<std::vector<std::pair<PenteGame::Move, float>>, float>;
 
 struct NNEvaluator::Impl {
     AlphaNet model{nullptr};
     torch::Device device{torch::cuda::is_available() ? torch::kCUDA : torch::kCPU};
-    // fp32 throughout. fp16 (kHalf) was tested but hurt throughput on this model
-    // (64 channels, 6 res blocks) — too small to saturate Tensor Cores, and pure
-    // fp16 destabilizes BatchNorm. Worth revisiting at 128+ channels, ideally with
-    // PyTorch AMP rather than a blunt model->to(kHalf).
+    // fp32 by default. fp16 (kHalf) was tested but hurt throughput on the old
+    // 64-channel, 6-block model — too small to saturate Tensor Cores. It has not
+    // been measured on the current 128-channel model, so it stays opt-in via
+    // NN_FP16=1 (CUDA only) until a benchmark says otherwise. Inference only: the
+    // model is in eval mode, so BatchNorm uses its stored running stats rather
+    // than fp16 batch statistics. Outputs are converted back to fp32 before they
+    // leave the evaluator.
     // Future: torch_tensorrt can compile a fixed-batch-size engine for 2-4x gains
     // by fusing ops and eliminating PyTorch dispatch overhead.
-    torch::ScalarType dtype{torch::kFloat};
+    torch::ScalarType dtype{device.is_cuda() && GameUtils::nnHalfPrecisionFromEnv() ? torch::kHalf
+                                                                                  : torch::kFloat};
+
+    // Optional position cache, off by default: set NN_CACHE_ENTRIES (env or
+    // .env) or call setCacheCapacity() to enable it. Transpositions and repeated
+    // openings are common across self-play games, and a forward pass costs far
+    // more than a lookup. Direct-mapped on the low key bits, newest entry wins a
+    // slot: a full cache evicts one position per miss instead of emptying out.
+    // Each filled slot holds a copy of the policy, ~8 bytes per legal move
+    // (~3 KB in the opening), so 65,536 entries can reach ~200 MB.
+    struct CacheSlot {
+        uint64_t key = 0;
+        bool used = false;
+        EvalResult result;
+    };
+    std::mutex cacheLock;
+    std::vector<CacheSlot> cache;  // empty (disabled) or a power-of-two size
+
+    void resizeCache(size_t entries) {
+        std::lock_guard<std::mutex> lock(cacheLock);
+        std::vector<CacheSlot>(entries ? std::bit_ceil(entries) : 0).swap(cache);
+    }
+
+    std::optional<EvalResult> lookup(uint64_t key) {
+        std::lock_guard<std::mutex> lock(cacheLock);
+        if (cache.empty()) return std::nullopt;
+        const CacheSlot &slot = cache[key & (cache.size() - 1)];
+        if (!slot.used || slot.key != key) return std::nullopt;
+        return slot.result;
+    }
+
+    void store(uint64_t key, const EvalResult &result) {
+        std::lock_guard<std::mutex> lock(cacheLock);
+        if (cache.empty()) return;
+        CacheSlot &slot = cache[key & (cache.size() - 1)];
+        slot.key = key;
+        slot.used = true;
+        slot.result = result;
+    }
 
     Impl() {
         model = AlphaNet(AlphaNetImpl::kChannels, AlphaNetImpl::kResBlocks);
-        model->eval();
-        model->to(device);
+        prepare();
+        resizeCache(GameUtils::nnCacheEntriesFromEnv());
     }
 
     explicit Impl(const std::string &path) {
         model = AlphaNet(AlphaNetImpl::kChannels, AlphaNetImpl::kResBlocks);
         torch::load(model, path);
+        prepare();
+        resizeCache(GameUtils::nnCacheEntriesFromEnv());
+    }
+
+    // Input shape is fixed apart from the batch dimension ([N, 5, 19, 19]), so
+    // let cuDNN benchmark its conv algorithms once per shape and reuse the
+    // fastest. The batch-1 warm-up pays that autotuning and CUDA context cost
+    // here rather than on the first search's first evaluation; each new batch
+    // size is tuned once, the first time it is seen.
+    void prepare() {
         model->eval();
-        model->to(device);
+        model->to(device, dtype);
+        if (!device.is_cuda()) return;
+        at::globalContext().setBenchmarkCuDNN(true);
+        constexpr int B = PenteGame::BOARD_SIZE;
+        torch::NoGradGuard no_grad;
+        model->forward(torch::zeros({1, AlphaNetImpl::kInputPlanes, B, B}, torch::dtype(dtype).device(device)),
+                       torch::zeros({1, 2}, torch::dtype(dtype).device(device)));
     }
 };
 
@@ -38,11 +102,33 @@ NNEvaluator::NNEvaluator(const std::string &modelPath)
 
 NNEvaluator::~NNEvaluator() = default;
 
-// Build input tensors from game state, from current player's perspective.
-std::pair<torch::Tensor, torch::Tensor> NNEvaluator::gameToTensors(const PenteGame &game) {
+void NNEvaluator::setCacheCapacity(size_t entries) {
+    impl_->resizeCache(entries);
+}
+
+namespace {
+
+// The Zobrist hash covers stones and capture counts but not side to move, so
+// fold the move count in to keep the key unambiguous. The variant matters too:
+// capturesToWin scales the capture planes, and the rule fields change the legal
+// moves the policy is filtered to, so one evaluator shared across variants must
+// not serve one variant's result to another.
+uint64_t cacheKey(const PenteGame &game) {
+    const PenteGame::Config &c = game.getConfig();
+    uint64_t variant = static_cast<uint64_t>(c.capturesToWin) | (static_cast<uint64_t>(c.keryoRules) << 8) |
+                       (static_cast<uint64_t>(c.capturesEnabled) << 9) |
+                       (static_cast<uint64_t>(c.tournamentRule) << 10) | (static_cast<uint64_t>(c.boardSize) << 16);
+    return game.getHash() ^ (static_cast<uint64_t>(game.getMoveCount()) * 0x9E3779B97F4A7C15ULL) ^
+           (variant * 0xBF58476D1CE4E5B9ULL);
+}
+
+// Write one position's network inputs, from the current player's perspective,
+// into zero-initialised accessors: planes [5, 19, 19] and captures [2]. Shared
+// by gameToTensors and evaluateBatch, which fills rows of one batch tensor
+// directly instead of building and stacking a tensor per position.
+template <typename PlaneAcc, typename CaptureAcc>
+void writeInputs(const PenteGame &game, PlaneAcc acc, CaptureAcc captures) {
     constexpr int B = PenteGame::BOARD_SIZE;
-    auto planes = torch::zeros({AlphaNetImpl::kInputPlanes, B, B});
-    auto acc = planes.accessor<float, 3>();
 
     bool blackToMove = (game.getCurrentPlayer() == PenteGame::BLACK);
     const BitBoard &myBB  = blackToMove ? game.getBlackBitBoard() : game.getWhiteBitBoard();
@@ -67,15 +153,26 @@ std::pair<torch::Tensor, torch::Tensor> NNEvaluator::gameToTensors(const PenteGa
             acc[4][y][x] = oppCapNorm;
         }
 
-    auto captures = torch::zeros({2});
     captures[0] = myCapNorm;
     captures[1] = oppCapNorm;
+}
+
+} // namespace
 
+// Build input tensors from game state, from current player's perspective.
+std::pair<torch::Tensor, torch::Tensor> NNEvaluator::gameToTensors(const PenteGame &game) {
+    constexpr int B = PenteGame::BOARD_SIZE;
+    auto planes   = torch::zeros({AlphaNetImpl::kInputPlanes, B, B});
+    auto captures = torch::zeros({2});
+    writeInputs(game, planes.accessor<float, 3>(), captures.accessor<float, 1>());
     return {planes, captures};
 }
 
 std::pair<std::vector<std::pair<PenteGame::Move, float>>, float>
 NNEvaluator::evaluate(const PenteGame &game) {
+    uint64_t key = cacheKey(game);
+    if (auto hit = impl_->lookup(key)) return *hit;
+
     auto [planes, captures] = gameToTensors(game);
 
     torch::NoGradGuard no_grad;
@@ -106,7 +203,9 @@ NNEvaluator::evaluate(const PenteGame &game) {
               [](const auto &a, const auto &b) { return a.second > b.second; });
 
     // NN is trained on previous-player (mover) perspective — matches MCTS backprop directly.
-    return {policy, valueTensor.item<float>()};
+    EvalResult result{std::move(policy), valueTensor.to(torch::kFloat).item<float>()};
+    impl_->store(key, result);
+    return result;
 }
 
 std::vector<std::pair<std::vector<std::pair<PenteGame::Move, float>>, float>>
@@ -116,29 +215,40 @@ NNEvaluator::evaluateBatch(const std::vector<PenteGame> &games) {
     constexpr int B = PenteGame::BOARD_SIZE;
     int N = (int)games.size();
 
-    std::vector<torch::Tensor> planeVec, captureVec;
-    planeVec.reserve(N);
-    captureVec.reserve(N);
-    for (const auto &g : games) {
-        auto [planes, captures] = gameToTensors(g);
-        planeVec.push_back(std::move(planes));
-        captureVec.push_back(std::move(captures));
+    // Serve cached positions directly; only the misses go through the network.
+    std::vector<EvalResult> results(N);
+    std::vector<uint64_t> keys(N);
+    std::vector<int> misses;
+    misses.reserve(N);
+    for (int i = 0; i < N; i++) {
+        keys[i] = cacheKey(games[i]);
+        if (auto hit = impl_->lookup(keys[i]))
+            results[i] = std::move(*hit);
+        else
+            misses.push_back(i);
     }
+    if (misses.empty()) return results;
 
-    auto batchPlanes   = torch::stack(planeVec,   0).to(impl_->device, impl_->dtype);  // [N, 5, 19, 19]
-    auto batchCaptures = torch::stack(captureVec, 0).to(impl_->device, impl_->dtype);  // [N, 2]
+    const int64_t M = static_cast<int64_t>(misses.size());
+    auto batchPlanes   = torch::zeros({M, AlphaNetImpl::kInputPlanes, B, B});  // [M, 5, 19, 19]
+    auto batchCaptures = torch::zeros({M, 2});                                // [M, 2]
+    auto planesAcc     = batchPlanes.accessor<float, 4>();
+    auto capturesAcc   = batchCaptures.accessor<float, 2>();
+    for (int64_t j = 0; j < M; j++)
+        writeInputs(games[misses[j]], planesAcc[j], capturesAcc[j]);
+
+    batchPlanes   = batchPlanes.to(impl_->device, impl_->dtype);
+    batchCaptures = batchCaptures.to(impl_->device, impl_->dtype);
 
     torch::NoGradGuard no_grad;
     auto [logPolicy, valueTensor] = impl_->model->forward(batchPlanes, batchCaptures);
 
-    auto probs  = torch::exp(logPolicy).to(torch::kFloat).cpu();  // [N, 361]
-    auto values = valueTensor.to(torch::kFloat).cpu();             // [N, 1]
-
-    std::vector<std::pair<std::vector<std::pair<PenteGame::Move, float>>, float>> results;
-    results.reserve(N);
+    auto probs  = torch::exp(logPolicy).to(torch::kFloat).cpu();  // [M, 361], M = misses
+    auto values = valueTensor.to(torch::kFloat).cpu();             // [M, 1]
 
-    for (int i = 0; i < N; i++) {
-        auto row = probs[i];
+    for (int j = 0; j < (int)misses.size(); j++) {
+        int i = misses[j];
+        auto row = probs[j];
         auto probsAcc = row.accessor<float, 1>();
         const auto &legalMoves = games[i].getLegalMoves();
 
@@ -159,7 +269,8 @@ NNEvaluator::evaluateBatch(const std::vector<PenteGame> &games) {
         std::sort(policy.begin(), policy.end(),
                   [](const auto &a, const auto &b) { return a.second > b.second; });
 
-        results.emplace_back(std::move(policy), values[i][0].item<float>());
+        results[i] = {std::move(policy), values[j][0].item<float>()};
+        impl_->store(keys[i], results[i]);
     }
 
     return results;
@@ -7,28 +7,6 @@
 
 thread_local ParallelMCTS::SlabView *ParallelMCTS::tl_slab = nullptr;
 
-// ============================================================================
-// VirtualLossManager Implementation
-// ============================================================================
-
-void ParallelMCTS::VirtualLossManager::addVirtualLoss(ThreadSafeNode *node, int32_t amount) {
-    if (!node) return;
-    node->virtualLosses.fetch_add(amount, std::memory_order_relaxed);
-}
-
-void ParallelMCTS::VirtualLossManager::removeVirtualLoss(ThreadSafeNode *node, int32_t amount) {
-    if (!node) return;
-    node->virtualLosses.fetch_sub(amount, std::memory_order_relaxed);
-}
-
-int32_t ParallelMCTS::VirtualLossManager::getEffectiveVisits(ThreadSafeNode *node) const {
-    if (!node) return 0;
-    // Effective visits accounts for virtual losses to reduce PUCT value during search
-    int32_t actual = node->visits.load(std::memory_order_relaxed);
-    int32_t virtual_losses = node->virtualLosses.load(std::memory_order_relaxed);
-    return actual + virtual_losses;
-}
-
 // ============================================================================
 // EvaluationQueue Implementation
 // ============================================================================
@@ -36,34 +14,69 @@ int32_t ParallelMCTS::VirtualLossManager::getEffectiveVisits(ThreadSafeNode *nod
 ParallelMCTS::EvaluationQueue::EvaluationQueue(size_t capacity) : capacity(capacity) {}
 
 bool ParallelMCTS::EvaluationQueue::tryPush(const EvaluationRequest &request) {
-    std::lock_guard<std::mutex> lock(queueLock);
-    if (queue.size() >= capacity) {
-        return false;  // Queue is full
+    return tryPush(request.node, request.gameState, request.searchPath);
+}
+
+bool ParallelMCTS::EvaluationQueue::tryPush(ThreadSafeNode *node, const PenteGame &gameState,
+                                            const std::vector<ThreadSafeNode *> &searchPath) {
+    {
+        std::lock_guard<std::mutex> lock(queueLock);
+        if (count >= capacity) {
+            return false;  // Queue is full
+        }
+        if (count == slots.size()) {
+            // Every slot is in use: unwrap the ring so head sits at 0, then grow by one.
+            std::rotate(slots.begin(), slots.begin() + head, slots.end());
+            head = 0;
+            slots.emplace_back();
+        }
+        // Copy straight into the slot: no intermediate EvaluationRequest (and
+        // its ~6 KB PenteGame) is constructed per push. syncFrom() copies only
+        // the position (~1 KB plus the move vector), not the ~5 KB rng state that
+        // plain assignment would, which keeps this critical section short.
+        EvaluationRequest &slot = slots[(head + count) % slots.size()];
+        slot.node       = node;
+        slot.gameState.syncFrom(gameState);
+        slot.searchPath = searchPath;
+        ++count;
     }
-    queue.push_back(request);
+    notEmpty.notify_one();
     return true;
 }
 
 std::vector<ParallelMCTS::EvaluationRequest> ParallelMCTS::EvaluationQueue::popBatch(size_t batchSize) {
     std::lock_guard<std::mutex> lock(queueLock);
+    return takeLocked(batchSize);
+}
+
+std::vector<ParallelMCTS::EvaluationRequest>
+ParallelMCTS::EvaluationQueue::waitPopBatch(size_t batchSize, std::chrono::milliseconds timeout) {
+    std::unique_lock<std::mutex> lock(queueLock);
+    notEmpty.wait_for(lock, timeout, [this] { return count > 0; });
+    return takeLocked(batchSize);
+}
+
+std::vector<ParallelMCTS::EvaluationRequest> ParallelMCTS::EvaluationQueue::takeLocked(size_t batchSize) {
+    size_t n = std::min(batchSize, count);
     std::vector<EvaluationRequest> batch;
-    batch.reserve(std::min(batchSize, queue.size()));
+    batch.reserve(n);
 
-    while (!queue.empty() && batch.size() < batchSize) {
-        batch.push_back(queue.front());
-        queue.pop_front();
+    for (size_t i = 0; i < n; i++) {
+        batch.push_back(std::move(slots[head]));
+        head = (head + 1) % slots.size();
     }
+    count -= n;
     return batch;
 }
 
 bool ParallelMCTS::EvaluationQueue::empty() const {
     std::lock_guard<std::mutex> lock(queueLock);
-    return queue.empty();
+    return count == 0;
 }
 
 size_t ParallelMCTS::EvaluationQueue::size() const {
     std::lock_guard<std::mutex> lock(queueLock);
-    return queue.size();
+    return count;
 }
 
 // ============================================================================
@@ -75,6 +88,12 @@ void ParallelMCTS::BackpropagationQueue::push(const EvaluationResult &result) {
     queue.push_back(result);
 }
 
+void ParallelMCTS::BackpropagationQueue::pushBatch(std::vector<EvaluationResult> &&results) {
+    std::lock_guard<std::mutex> lock(queueLock);
+    for (auto &result : results)
+        queue.push_back(std::move(result));
+}
+
 std::vector<ParallelMCTS::EvaluationResult> ParallelMCTS::BackpropagationQueue::popAll() {
     std::lock_guard<std::mutex> lock(queueLock);
     std::vector<EvaluationResult> results(queue.begin(), queue.end());
@@ -90,6 +109,18 @@ std::optional<ParallelMCTS::EvaluationResult> ParallelMCTS::BackpropagationQueue
     return result;
 }
 
+std::vector<ParallelMCTS::EvaluationResult> ParallelMCTS::BackpropagationQueue::tryPopBatch(size_t maxCount) {
+    std::lock_guard<std::mutex> lock(queueLock);
+    size_t n = std::min(maxCount, queue.size());
+    std::vector<EvaluationResult> results;
+    results.reserve(n);
+    for (size_t i = 0; i < n; i++) {
+        results.push_back(std::move(queue.front()));
+        queue.pop_front();
+    }
+    return results;
+}
+
 bool ParallelMCTS::BackpropagationQueue::empty() const {
     std::lock_guard<std::mutex> lock(queueLock);
     return queue.empty();
@@ -216,8 +247,20 @@ void ParallelMCTS::WorkerPool::workerThreadMain(int workerId) {
         return;
     }
 
+    // Everything this worker shares with the search is bound once here, at
+    // thread start, rather than re-read through `parent` on every iteration.
+    const Config &config       = parent->config_;
+    Evaluator *const evaluator = config.evaluator;
+    EvaluationQueue &evalQueue = *parent->evaluationQueue_;
+    BackpropagationQueue &backpropQueue = *parent->backpropagationQueue_;
+    const bool inlineEval      = (config.numEvalThreads == 0);
+    const bool capInFlight     = !inlineEval && config.numWorkerThreads == 1;
+
     PenteGame workerGame;
-    int maxIterations = parent->config_.maxIterations;
+    // Reused across iterations: clear() keeps the capacity, so steady-state
+    // selection does not allocate a fresh path vector per simulation.
+    std::vector<ThreadSafeNode *> searchPath;
+    int maxIterations = config.maxIterations;
 
     try {
     while (running) {
@@ -234,22 +277,22 @@ void ParallelMCTS::WorkerPool::workerThreadMain(int workerId) {
         // and — critically — VLs are *intentional* in parallel search to discourage
         // workers from piling onto the same path.
         bool claimSlot = true;
-        if (parent->config_.numEvalThreads > 0 && parent->config_.numWorkerThreads == 1) {
+        if (capInFlight) {
             int inFlight = parent->totalInProgress.load(std::memory_order_relaxed)
                          - parent->totalIterations.load(std::memory_order_relaxed);
-            claimSlot = (inFlight < parent->config_.evaluationBatchSize);
+            claimSlot = (inFlight < config.evaluationBatchSize);
         }
 
         if (claimSlot) {
         int slot = parent->totalInProgress.fetch_add(1, std::memory_order_relaxed);
         if (slot < maxIterations) {
-            std::vector<ThreadSafeNode *> searchPath;
+            searchPath.clear();
 
             workerGame.syncFrom(rootGame);
             searchPath.push_back(root);
             ThreadSafeNode *leaf = parent->select(root, workerGame, searchPath);
 
-            if (parent->config_.numEvalThreads == 0) {
+            if (inlineEval) {
                 // Inline mode: evaluate, expand, and backprop in this worker.
                 // No queue round-trip — eliminates pipeline overhead when the
                 // evaluator is cheap (CPU heuristic).
@@ -262,10 +305,10 @@ void ParallelMCTS::WorkerPool::workerThreadMain(int workerId) {
                 if (workerGame.isGameOver()) {
                     value = 1.0f;
                 } else {
-                    value = parent->config_.evaluator->evaluateValue(workerGame);
+                    value = evaluator->evaluateValue(workerGame);
                 }
 
-                auto  policy = parent->config_.evaluator->evaluatePolicy(workerGame);
+                auto  policy = evaluator->evaluatePolicy(workerGame);
                 parent->expand(leaf, workerGame, value, policy);
                 parent->backpropagate(leaf, value, searchPath);
                 parent->totalIterations.fetch_add(1, std::memory_order_relaxed);
@@ -305,17 +348,13 @@ void ParallelMCTS::WorkerPool::workerThreadMain(int workerId) {
                         if (leaf->evaluated.compare_exchange_strong(
                                 expected, true,
                                 std::memory_order_acq_rel, std::memory_order_relaxed)) {
-                            EvaluationRequest request;
-                            request.node       = leaf;
-                            request.gameState  = workerGame;
-                            request.searchPath = searchPath;
-                            if (!parent->evaluationQueue_->tryPush(request)) {
+                            if (!evalQueue.tryPush(leaf, workerGame, searchPath)) {
                                 // Queue full — un-claim and remove VLs applied during descent
                                 leaf->evaluated.store(false, std::memory_order_release);
                                 parent->totalInProgress.fetch_sub(1, std::memory_order_relaxed);
                                 for (auto *n : searchPath)
                                     if (n->virtualLosses.load(std::memory_order_relaxed) > 0)
-                                        parent->virtualLossManager_->removeVirtualLoss(n);
+                                        parent->virtualLossManager_.removeVirtualLoss(n);
                             }
                         } else {
                             // Another worker already claimed this leaf — release slot and
@@ -325,7 +364,7 @@ void ParallelMCTS::WorkerPool::workerThreadMain(int workerId) {
                             parent->totalInProgress.fetch_sub(1, std::memory_order_relaxed);
                             for (auto *n : searchPath)
                                 if (n->virtualLosses.load(std::memory_order_relaxed) > 0)
-                                    parent->virtualLossManager_->removeVirtualLoss(n);
+                                    parent->virtualLossManager_.removeVirtualLoss(n);
                         }
                     }
                 }
@@ -335,15 +374,17 @@ void ParallelMCTS::WorkerPool::workerThreadMain(int workerId) {
         }
         } // claimSlot
 
-        // PHASE 2 (queue mode only): pull one backprop result per loop iteration.
+        // PHASE 2 (queue mode only): pull a few backprop results per loop iteration.
         // In single-worker mode the in-flight cap above stalls Phase 1 once the cap
-        // is hit, so the worker drains one result here and unblocks. In multi-worker
+        // is hit, so the worker drains results here and unblocks. In multi-worker
         // mode N workers drain concurrently — no cap needed, eval threads stay fed.
-        if (parent->config_.numEvalThreads > 0) {
-            auto result = parent->backpropagationQueue_->tryPop();
-            if (result.has_value()) {
-                parent->expand(result->node, result->gameState, result->value, result->policy);
-                parent->backpropagate(result->node, result->value, result->searchPath);
+        // Taking a small batch per lock keeps workers from queueing on the backprop
+        // mutex once per result while an eval thread is publishing a full batch.
+        if (!inlineEval) {
+            auto results = backpropQueue.tryPopBatch(kBackpropDrainBatch);
+            for (auto &result : results) {
+                parent->expand(result.node, result.gameState, result.value, result.policy);
+                parent->backpropagate(result.node, result.value, result.searchPath);
                 parent->totalIterations.fetch_add(1, std::memory_order_relaxed);
             }
         }
@@ -410,31 +451,41 @@ void ParallelMCTS::EvalPool::evalThreadMain(int /*evalId*/) {
     int batchCount = 0;
     // ~10 prints per run: interval in real (non-empty) batches
     int printEvery = std::max(1, parent->config_.maxIterations / parent->config_.evaluationBatchSize / 10);
+
+    Evaluator *const evaluator = parent->config_.evaluator;
+    EvaluationQueue &evalQueue = *parent->evaluationQueue_;
+    BackpropagationQueue &backpropQueue = *parent->backpropagationQueue_;
+    const size_t batchSize     = parent->config_.evaluationBatchSize;
+
     while (running) {
-        auto batch = parent->evaluationQueue_->popBatch(parent->config_.evaluationBatchSize);
+        // Sleep on the queue instead of spinning with yield(); the short timeout
+        // bounds how long stop() waits for this thread to notice running == false.
+        auto batch = evalQueue.waitPopBatch(batchSize, std::chrono::milliseconds(1));
 
         if (!batch.empty()) {
             // if (++batchCount % printEvery == 0)
             //     fprintf(stderr, "[eval] queue=%zu batch=%zu\n",
             //             parent->evaluationQueue_->size(), batch.size());
+            // The popped batch is ours: move each game state into the evaluator's
+            // input and from there into its result, rather than copying it twice.
             std::vector<PenteGame> games;
             games.reserve(batch.size());
-            for (const auto &req : batch)
-                games.push_back(req.gameState);
+            for (auto &req : batch)
+                games.push_back(std::move(req.gameState));
 
-            auto evalResults = parent->config_.evaluator->evaluateBatch(games);
+            auto evalResults = evaluator->evaluateBatch(games);
 
+            // Publish the whole batch at once: workers contend on the backprop
+            // queue lock, so one acquisition per batch instead of per result.
+            // Results are built in place: default-constructing one first would
+            // seed a fresh PenteGame (random_device + rng) only to overwrite it.
+            std::vector<EvaluationResult> results;
+            results.reserve(batch.size());
             for (size_t i = 0; i < batch.size(); i++) {
-                EvaluationResult result;
-                result.node       = batch[i].node;
-                result.gameState  = batch[i].gameState;
-                result.searchPath = batch[i].searchPath;
-                result.policy     = std::move(evalResults[i].first);
-                result.value      = evalResults[i].second;
-                parent->backpropagationQueue_->push(result);
+                results.push_back({batch[i].node, std::move(games[i]), evalResults[i].second,
+                                   std::move(evalResults[i].first), std::move(batch[i].searchPath)});
             }
-        } else {
-            std::this_thread::yield();
+            backpropQueue.pushBatch(std::move(results));
         }
     }
 }
@@ -448,7 +499,6 @@ ParallelMCTS::ParallelMCTS(const Config &config) : config_(config) {
     arena_ = std::make_unique<Arena>(config_.arenaSize);
 
     // Initialize queues and managers
-    virtualLossManager_ = std::make_unique<VirtualLossManager>();
     evaluationQueue_ = std::make_unique<EvaluationQueue>(config_.queueCapacity);
     backpropagationQueue_ = std::make_unique<BackpropagationQueue>();
 
@@ -551,7 +601,11 @@ void ParallelMCTS::prepareRoot(const PenteGame &game) {
     std::lock_guard<std::mutex> lock(treeLock);
 
     if (root_ && root_->positionHash == game.getHash()) {
-        return;  // reuse existing tree for same position
+        // Reuse the existing tree for the same position. It may come from
+        // reuseSubtree(), whose root was expanded as an ordinary node and never
+        // scanned, so run the scan here as well.
+        proveImmediateRootWin(game);
+        return;
     }
 
     root_ = allocateNode();
@@ -577,6 +631,44 @@ void ParallelMCTS::prepareRoot(const PenteGame &game) {
     root_->childCount = static_cast<uint16_t>(capacity);
     root_->expanded = true;
     root_->evaluated = true;
+
+    proveImmediateRootWin(game);
+}
+
+// Immediate-win short-circuit: if some root move ends the game in the mover's
+// favour, prove it here so search() skips the simulations entirely (the workers
+// see a terminal root and exit, and the remaining iterations are credited to the
+// winning child). Runs for fresh and reused roots alike. Caller holds treeLock.
+void ParallelMCTS::proveImmediateRootWin(const PenteGame &game) {
+    // A player needs at least five stones to win, so skip the scan before then.
+    if (game.getMoveCount() < 8) return;
+    // Nothing to scan if the root was never expanded, or its child arrays could
+    // not be allocated because the arena ran out.
+    if (!root_->expanded.load(std::memory_order_acquire) || !root_->children || !root_->moves) return;
+    if (root_->isTerminal()) return;
+
+    const PenteGame::Player mover = game.getCurrentPlayer();
+    PenteGame scratch(game.getConfig());
+    for (int i = 0; i < root_->childCapacity; ++i) {
+        scratch.syncFrom(game);
+        scratch.makeMove(root_->moves[i].x, root_->moves[i].y);
+        if (scratch.getWinner() != mover) continue;
+
+        ThreadSafeNode *child = root_->children[i];
+        if (!child) {
+            child = allocateNode();
+            if (!child) return;
+            child->move = root_->moves[i];
+            child->player = scratch.getCurrentPlayer();
+            child->positionHash = scratch.getHash();
+            child->value = 1.0f;
+            root_->children[i] = child;
+        }
+        child->solvedStatus.store(SolvedStatus::SOLVED_WIN, std::memory_order_relaxed);
+        // The player to move at the root wins, so the move into the root loses.
+        root_->solvedStatus.store(SolvedStatus::SOLVED_LOSS, std::memory_order_release);
+        return;
+    }
 }
 
 const ParallelMCTS::ThreadSafeNode *ParallelMCTS::getRoot() const {
@@ -850,7 +942,7 @@ ParallelMCTS::ThreadSafeNode *ParallelMCTS::select(ThreadSafeNode *node, PenteGa
             }
         }
 
-        virtualLossManager_->addVirtualLoss(child);
+        virtualLossManager_.addVirtualLoss(child);
         node = child;
         searchPath.push_back(node);
     }
@@ -924,7 +1016,7 @@ void ParallelMCTS::backpropagate(ThreadSafeNode *node, float value,
 
         // Remove virtual loss if one was applied (root has none)
         if (current->virtualLosses.load(std::memory_order_relaxed) > 0)
-            virtualLossManager_->removeVirtualLoss(current);
+            virtualLossManager_.removeVirtualLoss(current);
 
         // Minimax solved-status propagation
         if (!searchPath.empty()) {
@@ -1000,7 +1092,7 @@ int ParallelMCTS::selectBestMoveIndex(ThreadSafeNode *node, const PenteGame &gam
             effectiveVisits = 0;
             exploitation    = fpu;
         } else {
-            effectiveVisits = virtualLossManager_->getEffectiveVisits(child);
+            effectiveVisits = virtualLossManager_.getEffectiveVisits(child);
             auto childStatus = child->solvedStatus.load(std::memory_order_acquire);
             if (childStatus == SolvedStatus::SOLVED_WIN) {
                 exploitation = std::numeric_limits<double>::infinity();
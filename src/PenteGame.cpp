@@ -14,6 +14,7 @@ PenteGame::PenteGame(const Config &config) : config_(config), rng_(config.seed ?
 void PenteGame::reset() {
     blackStones.clear();
     whiteStones.clear();
+    occupiedStones.clear();
 
     // promising starts with only the center (the only valid first move)
     promisingMovesVector.clear();
@@ -28,12 +29,13 @@ void PenteGame::reset() {
     whiteCaptures = 0;
     moveCount = 0;
     lastMove = Move();
+    winner_ = NONE;
     hash_ = Zobrist::instance().computeFullHash(blackStones, whiteStones, blackCaptures, whiteCaptures);
 }
 
 bool PenteGame::makeMove(const char *move) {
     auto [x, y] = GameUtils::parseMove(move);
-    if (blackStones.getBit(x, y) || whiteStones.getBit(x, y)) {
+    if (occupiedStones.getBit(x, y)) {
         return false;
     }
 
@@ -59,12 +61,14 @@ bool PenteGame::makeMove(int x, int y) {
     int pIdx = Zobrist::playerIndex(currentPlayer);
     int cell = y * BOARD_SIZE + x;
 
-    // Place stone
+    // Place stone. (x, y) is on the board: cell already indexes the Zobrist
+    // tables unchecked, so the bounds-checked setBit would only re-test it.
     if (currentPlayer == BLACK) {
-        blackStones.setBit(x, y);
+        blackStones.setBitUnchecked(x, y);
     } else {
-        whiteStones.setBit(x, y);
+        whiteStones.setBitUnchecked(x, y);
     }
+    occupiedStones.setBitUnchecked(x, y);
     hash_ ^= zob.stoneKeys[pIdx][cell];
     clearLegalMove(x, y);
 
@@ -86,6 +90,7 @@ bool PenteGame::makeMove(int x, int y) {
     lastMove = Move(x, y);
     moveCount++;
     currentPlayer = (currentPlayer == BLACK) ? WHITE : BLACK;
+    winner_ = computeWinner();
 
     return true;
 }
@@ -185,6 +190,7 @@ int PenteGame::checkAndCapture(int x, int y) {
     }
 
     if (totalCapturedStones > 0) {
+        occupiedStones = blackStones | whiteStones;
         patchPromisingMovesAfterCaptures(capturedBits);
     }
 
@@ -193,49 +199,32 @@ int PenteGame::checkAndCapture(int x, int y) {
 
 void PenteGame::patchPromisingMovesAfterCaptures(const BitBoard &capturedBits) {
     PROFILE_SCOPE("PenteGame::patchPromisingMovesAfterCaptures");
-    // Build the set of cells to re-evaluate: captured positions + their dilation neighborhoods
-    BitBoard toCheck;
-    capturedBits.forEachSetBit([&](int cell) {
-        int cx = cell % BOARD_SIZE, cy = cell / BOARD_SIZE;
-        toCheck.setBitUnchecked(cx, cy);
-        for (int i = 0; i < config_.numOffsets; i++) {
-            int nx = cx + dirs[i][0], ny = cy + dirs[i][1];
-            if (nx >= 0 && nx < BOARD_SIZE && ny >= 0 && ny < BOARD_SIZE)
-                toCheck.setBitUnchecked(nx, ny);
-        }
-    });
+    // Re-evaluate the captured cells and their dilation neighbourhoods. A cell is
+    // promising when it is one offset step from some stone (what clearLegalMove
+    // adds), which is answered for the whole board at once by dilating the
+    // stones. operator~ masks the bits past the last cell, so the candidates are
+    // in-board empty cells only.
+    const int numOffsets = config_.numOffsets;
+    BitBoard nearStones = occupiedStones.dilateBy(dirs, numOffsets);
+    BitBoard toCheck = (capturedBits | capturedBits.dilateBy(dirs, numOffsets)) & ~occupiedStones;
 
     toCheck.forEachSetBit([&](int cell) {
         int x = cell % BOARD_SIZE, y = cell / BOARD_SIZE;
-
-        // Occupied cells are never promising
-        if (blackStones.getBitUnchecked(x, y) || whiteStones.getBitUnchecked(x, y)) return;
-
-        // Check if this empty cell has at least one occupied neighbor within dilation distance
-        bool hasNeighbor = false;
-        for (int i = 0; i < config_.numOffsets; i++) {
-            int nx = x + dirs[i][0], ny = y + dirs[i][1];
-            if (nx >= 0 && nx < BOARD_SIZE && ny >= 0 && ny < BOARD_SIZE) {
-                if (blackStones.getBitUnchecked(nx, ny) || whiteStones.getBitUnchecked(nx, ny)) {
-                    hasNeighbor = true;
-                    break;
-                }
-            }
-        }
+        bool hasNeighbor = nearStones.getBitUnchecked(x, y);
 
         size_t pos = encodePos(x, y);
         bool inPromising = promisingMoveIndex[pos] != INVALID_INDEX;
 
         if (hasNeighbor && !inPromising) {
             promisingMovesVector.emplace_back(x, y);
-            promisingMoveIndex[pos] = promisingMovesVector.size() - 1;
+            promisingMoveIndex[pos] = static_cast<uint16_t>(promisingMovesVector.size() - 1);
         } else if (!hasNeighbor && inPromising) {
             size_t idx = promisingMoveIndex[pos];
             size_t lastIdx = promisingMovesVector.size() - 1;
             if (idx != lastIdx) {
                 Move last = promisingMovesVector.back();
                 promisingMovesVector[idx] = last;
-                promisingMoveIndex[encodePos(last.x, last.y)] = idx;
+                promisingMoveIndex[encodePos(last.x, last.y)] = static_cast<uint16_t>(idx);
             }
             promisingMovesVector.pop_back();
             promisingMoveIndex[pos] = INVALID_INDEX;
@@ -260,7 +249,7 @@ bool PenteGame::isLegalMove(int x, int y) const {
 
 const std::vector<PenteGame::Move> &PenteGame::getLegalMoves() const {
     PROFILE_SCOPE("PenteGame::getLegalMoves");
-    if (config_.tournamentRule && moveCount == 2 && blackStones.getBit(9, 9)) {
+    if (config_.tournamentRule && moveCount == 2 && blackStones.getBitUnchecked(9, 9)) {
         return getTournamentRulePerimeter();
     }
     // assumption that we can treat promising moves as legal moves. 
@@ -268,8 +257,8 @@ const std::vector<PenteGame::Move> &PenteGame::getLegalMoves() const {
     return promisingMovesVector;
 }
 
-PenteGame::Player PenteGame::getWinner() const {
-    PROFILE_SCOPE("PenteGame::getWinner");
+PenteGame::Player PenteGame::computeWinner() const {
+    PROFILE_SCOPE("PenteGame::computeWinner");
 
     // Check for capture wins
     if (blackCaptures >= config_.capturesToWin)
@@ -292,42 +281,34 @@ bool PenteGame::isGameOver() const {
     return getWinner() != NONE;
 }
 
-bool PenteGame::checkFiveInRow(int x, int y) const {
-    // Get the stones of the player who just moved
-    const BitBoard &stones = (currentPlayer == WHITE) ? blackStones : whiteStones;
-
-    // Check all 4 directions through the last move
-    const int dirs[4][2] = {{1, 0}, {0, 1}, {1, 1}, {1, -1}};
-
-    for (auto [dx, dy] : dirs) {
-        int count = 1; // Count the stone we just placed
-
-        // Count in positive direction
-        count += countConsecutive(stones, x, y, dx, dy);
-
-        // Count in negative direction
-        count += countConsecutive(stones, x, y, -dx, -dy);
+namespace {
 
-        if (count >= 5) {
-            return true;
-        }
-    }
+// Stones in a row from (x, y) exclusive along (DX, DY). The direction is a
+// template argument so each of checkFiveInRow's eight walks compiles to its own
+// loop with the step and the edge test it needs folded in.
+template <int DX, int DY> int runAlong(const BitBoard &stones, int x, int y) {
+    constexpr int N = PenteGame::BOARD_SIZE;
+    int count = 0;
+    for (x += DX, y += DY; (DX >= 0 || x >= 0) && (DX <= 0 || x < N) && (DY >= 0 || y >= 0) &&
+                           (DY <= 0 || y < N) && stones.getBitUnchecked(x, y);
+         x += DX, y += DY)
+        count++;
+    return count;
+}
 
-    return false;
+template <int DX, int DY> bool fiveThrough(const BitBoard &stones, int x, int y) {
+    return 1 + runAlong<DX, DY>(stones, x, y) + runAlong<-DX, -DY>(stones, x, y) >= 5;
 }
 
-int PenteGame::countConsecutive(const BitBoard &stones, int x, int y, int dx, int dy) const {
-    int count = 0;
-    int nx = x + dx;
-    int ny = y + dy;
+} // namespace
 
-    while (nx >= 0 && nx < BOARD_SIZE && ny >= 0 && ny < BOARD_SIZE && stones.getBitUnchecked(nx, ny)) {
-        count++;
-        nx += dx;
-        ny += dy;
-    }
+bool PenteGame::checkFiveInRow(int x, int y) const {
+    // Get the stones of the player who just moved
+    const BitBoard &stones = (currentPlayer == WHITE) ? blackStones : whiteStones;
 
-    return count;
+    // Check all 4 directions through the last move
+    return fiveThrough<1, 0>(stones, x, y) || fiveThrough<0, 1>(stones, x, y) ||
+           fiveThrough<1, 1>(stones, x, y) || fiveThrough<1, -1>(stones, x, y);
 }
 
 std::vector<PenteGame::Move> PenteGame::getPromisingMoves(int distance) const {
@@ -337,7 +318,7 @@ std::vector<PenteGame::Move> PenteGame::getPromisingMoves(int distance) const {
         throw std::invalid_argument("getPromisingMoves: distance must be 1, 2, or 15");
     }
 
-    BitBoard occupied = blackStones | whiteStones;
+    const BitBoard &occupied = occupiedStones;
     BitBoard nearby;
     if (distance == 1) {
         nearby = occupied.dilate();
@@ -376,6 +357,7 @@ void PenteGame::syncFrom(const PenteGame &other) {
     config_ = other.config_;
     blackStones = other.blackStones;
     whiteStones = other.whiteStones;
+    occupiedStones = other.occupiedStones;
     promisingMovesVector = other.promisingMovesVector;
     promisingMoveIndex = other.promisingMoveIndex;
     currentPlayer = other.currentPlayer;
@@ -383,10 +365,16 @@ void PenteGame::syncFrom(const PenteGame &other) {
     whiteCaptures = other.whiteCaptures;
     moveCount = other.moveCount;
     lastMove = other.lastMove;
+    winner_ = other.winner_;
     hash_ = other.hash_;
     // Note: rng_ intentionally NOT copied - each game instance advances its own rng
 }
 
+void PenteGame::syncFromWithRng(const PenteGame &other) {
+    syncFrom(other);
+    rng_ = other.rng_;
+}
+
 uint64_t PenteGame::computeHash() const {
     const auto &zob = Zobrist::instance();
     return zob.computeFullHash(blackStones, whiteStones, blackCaptures, whiteCaptures);
@@ -416,7 +404,30 @@ PenteGame::Player PenteGame::getStoneAt(int x, int y) const {
     return NONE;
 }
 
+void PenteGame::fillCellMap(CellMap &map) const {
+    map.cells.fill(CellMap::WALL);
+    for (int y = 0; y < BOARD_SIZE; y++)
+        std::memset(&map.cells[(y + CellMap::PAD) * CellMap::WIDTH + CellMap::PAD], NONE, BOARD_SIZE);
+    auto place = [&](int cell, Player p) {
+        map.cells[(cell / BOARD_SIZE + CellMap::PAD) * CellMap::WIDTH + cell % BOARD_SIZE + CellMap::PAD] = p;
+    };
+    blackStones.forEachSetBit([&](int cell) { place(cell, BLACK); });
+    whiteStones.forEachSetBit([&](int cell) { place(cell, WHITE); });
+}
+
 float PenteGame::evaluateMove(Move move) const {
+    return scoreMove(move, StoneCells{blackStones, whiteStones});
+}
+
+void PenteGame::evaluateMoves(const std::vector<Move> &moves, std::vector<float> &scores) const {
+    CellMap map;
+    fillCellMap(map);
+    scores.resize(moves.size());
+    for (size_t i = 0; i < moves.size(); i++)
+        scores[i] = scoreMove(moves[i], map);
+}
+
+template <typename Cells> float PenteGame::scoreMove(Move move, const Cells &cells) const {
     // Scoring weights
     constexpr float DEFAULT_SCORE = 1.0f;
     constexpr float CAPTURE_SCORE = 6.0f;
@@ -449,16 +460,21 @@ float PenteGame::evaluateMove(Move move) const {
     int blockFiveThreatCount = 0;
     bool isVulnerableMove = false;
 
-    const BitBoard &myStones = (currentPlayer == BLACK) ? blackStones : whiteStones;
-    const BitBoard &oppStones = (currentPlayer == BLACK) ? whiteStones : blackStones;
+    const Player me = currentPlayer;
+    const Player opp = (currentPlayer == BLACK) ? WHITE : BLACK;
 
-    // Helper lambdas
+    // Helper lambdas - off-board cells read as WALL, so no bounds checks needed
     auto inBounds = [](int px, int py) { return px >= 0 && px < BOARD_SIZE && py >= 0 && py < BOARD_SIZE; };
-    auto isEmpty = [&](int px, int py) {
-        return inBounds(px, py) && !myStones.getBitUnchecked(px, py) && !oppStones.getBitUnchecked(px, py);
+    auto isEmpty = [&](int px, int py) { return cells.at(px, py) == NONE; };
+    auto hasMy = [&](int px, int py) { return cells.at(px, py) == me; };
+    auto hasOpp = [&](int px, int py) { return cells.at(px, py) == opp; };
+    // Stones of player p in a row from (px, py) exclusive, stepping by (dx, dy)
+    auto run = [&](Player p, int px, int py, int dx, int dy) {
+        int count = 0;
+        for (px += dx, py += dy; cells.at(px, py) == p; px += dx, py += dy)
+            count++;
+        return count;
     };
-    auto hasMy = [&](int px, int py) { return inBounds(px, py) && myStones.getBitUnchecked(px, py); };
-    auto hasOpp = [&](int px, int py) { return inBounds(px, py) && oppStones.getBitUnchecked(px, py); };
 
     // 8 directions for capture checks
     static const int dirs[8][2] = {{0, 1}, {1, 0}, {1, 1}, {-1, 1}, {0, -1}, {-1, 0}, {-1, -1}, {1, -1}};
@@ -473,13 +489,11 @@ float PenteGame::evaluateMove(Move move) const {
 
         if (x3 >= 0 && x3 < BOARD_SIZE && y3 >= 0 && y3 < BOARD_SIZE) {
             // Capture: myStone - oppStone - oppStone - _ (we complete capture)
-            if (oppStones.getBitUnchecked(x1, y1) && oppStones.getBitUnchecked(x2, y2) &&
-                myStones.getBitUnchecked(x3, y3)) {
+            if (hasOpp(x1, y1) && hasOpp(x2, y2) && hasMy(x3, y3)) {
                 captureCount++;
             }
             // Block capture: oppStone - myStone - myStone - _ (we prevent their capture)
-            else if (myStones.getBitUnchecked(x1, y1) && myStones.getBitUnchecked(x2, y2) &&
-                     oppStones.getBitUnchecked(x3, y3)) {
+            else if (hasMy(x1, y1) && hasMy(x2, y2) && hasOpp(x3, y3)) {
                 blockCaptureCount++;
             }
         }
@@ -526,8 +540,8 @@ float PenteGame::evaluateMove(Move move) const {
         int dy = lineDirs[i][1];
 
         // Count consecutive stones from position (not including position itself)
-        int posCount = countConsecutive(myStones, x, y, dx, dy);
-        int negCount = countConsecutive(myStones, x, y, -dx, -dy);
+        int posCount = run(me, x, y, dx, dy);
+        int negCount = run(me, x, y, -dx, -dy);
         int total = 1 + posCount + negCount;
 
         // === CREATE FIVE THREAT (OPEN FOUR) DETECTION ===
@@ -588,8 +602,8 @@ float PenteGame::evaluateMove(Move move) const {
         }
 
         // === BLOCK OPPONENT'S FIVE THREAT ===
-        int oppPosCount = countConsecutive(oppStones, x, y, dx, dy);
-        int oppNegCount = countConsecutive(oppStones, x, y, -dx, -dy);
+        int oppPosCount = run(opp, x, y, dx, dy);
+        int oppNegCount = run(opp, x, y, -dx, -dy);
         int oppTotal = 1 + oppPosCount + oppNegCount;
 
         // Blocking an immediate opponent win (they have 4 in a row adjacent to this square)
@@ -781,54 +795,32 @@ float PenteGame::evaluateMove(Move move) const {
     return std::max(0.5f, score);
 }
 
-int PenteGame::countOpenFours(Player player) const {
-    const BitBoard &stones = (player == BLACK) ? blackStones : whiteStones;
-    const BitBoard &oppStones = (player == BLACK) ? whiteStones : blackStones;
-
-    int openFourCount = 0;
-
-    // 4 line directions
-    static const int lineDirs[4][2] = {{1, 0}, {0, 1}, {1, 1}, {1, -1}};
-
-    // Scan the board for open four patterns: _XXXX_
-    for (int y = 0; y < BOARD_SIZE; y++) {
-        for (int x = 0; x < BOARD_SIZE; x++) {
-            // Only check from stones of the player
-            if (!stones.getBit(x, y))
-                continue;
-
-            for (int d = 0; d < 4; d++) {
-                int dx = lineDirs[d][0];
-                int dy = lineDirs[d][1];
-
-                // Check for 4 consecutive stones starting at (x,y)
-                // Pattern: _XXXX_ where first X is at (x,y)
-                int x1 = x + dx, y1 = y + dy;
-                int x2 = x + dx * 2, y2 = y + dy * 2;
-                int x3 = x + dx * 3, y3 = y + dy * 3;
-
-                // Check all 4 stones exist
-                if (x3 < 0 || x3 >= BOARD_SIZE || y3 < 0 || y3 >= BOARD_SIZE)
-                    continue;
-                if (!stones.getBit(x1, y1) || !stones.getBit(x2, y2) || !stones.getBit(x3, y3))
-                    continue;
-
-                // Check both ends are empty (open)
-                int beforeX = x - dx, beforeY = y - dy;
-                int afterX = x + dx * 4, afterY = y + dy * 4;
+namespace {
+
+// Cells starting four `stones` along (DX, DY) with at least one end cell empty.
+// Whole-board shift-and instead of probing every cell: a bit survives in `run`
+// when its cell starts four stones along the direction.
+template <int DX, int DY> int countFoursAlong(const BitBoard &stones, const BitBoard &empty) {
+    BitBoard run = stones & stones.shiftToward<DX, DY>();                          // X at c, c+d
+    run = run & run.shiftToward<DX, DY>().template shiftToward<DX, DY>();          // X at c .. c+3d
+    BitBoard before = empty.shiftToward<-DX, -DY>();                               // empty at c-d
+    BitBoard after = empty.shiftToward<DX, DY>()
+                         .template shiftToward<DX, DY>()
+                         .template shiftToward<DX, DY>()
+                         .template shiftToward<DX, DY>();                          // empty at c+4d
+    return (run & (before | after)).count();
+}
 
-                bool beforeOpen = (beforeX >= 0 && beforeX < BOARD_SIZE && beforeY >= 0 && beforeY < BOARD_SIZE &&
-                                   !stones.getBit(beforeX, beforeY) && !oppStones.getBit(beforeX, beforeY));
+} // namespace
 
-                bool afterOpen = (afterX >= 0 && afterX < BOARD_SIZE && afterY >= 0 && afterY < BOARD_SIZE &&
-                                  !stones.getBit(afterX, afterY) && !oppStones.getBit(afterX, afterY));
+int PenteGame::countOpenFours(Player player) const {
+    const BitBoard &stones = (player == BLACK) ? blackStones : whiteStones;
 
-                if (beforeOpen || afterOpen) {
-                    openFourCount++;
-                }
-            }
-        }
-    }
+    // Pattern: _XXXX_ or _XXXXO / OXXXX_, i.e. at least one end empty, in the
+    // 4 line directions {1, 0}, {0, 1}, {1, 1}, {1, -1}.
+    BitBoard empty = ~occupiedStones;
+    int openFourCount = countFoursAlong<1, 0>(stones, empty) + countFoursAlong<0, 1>(stones, empty) +
+                        countFoursAlong<1, 1>(stones, empty) + countFoursAlong<1, -1>(stones, empty);
 
     // Each open four is counted once (from the first stone in the direction)
     return openFourCount;
@@ -23,13 +23,13 @@ uint64_t Zobrist::computeCanonicalHash(const BitBoard &blackStones, const BitBoa
     // XOR stones (using precomposed symmetry keys)
     blackStones.forEachSetBit([&](int cell) {
         for (int s = 0; s < 8; ++s) {
-            h[s] ^= symStoneKeys[s][0][cell];
+            h[s] ^= symStoneKeys[0][cell][s];
         }
     });
 
     whiteStones.forEachSetBit([&](int cell) {
         for (int s = 0; s < 8; ++s) {
-            h[s] ^= symStoneKeys[s][1][cell];
+            h[s] ^= symStoneKeys[1][cell][s];
         }
     });
 
@@ -69,6 +69,19 @@ TEST_CASE("BitBoard getSetPositions with pair") {
     CHECK(found_7_8);
 }
 
+TEST_CASE("BitBoard getSetPositions ignores bits shifted past the last cell") {
+    BitBoard board(19);
+
+    board.setBit(5, 18);   // bottom row
+    board.setBit(18, 17);  // right edge, one row up
+
+    // Shifting down a row pushes (5, 18) into the unused bits past cell 360
+    auto positions = board.shiftFixed(19).getSetPositions();
+
+    REQUIRE(positions.size() == 1);
+    CHECK(positions[0] == std::make_pair(18, 18));
+}
+
 TEST_CASE("BitBoard getSetPositions with PenteGame::Move") {
     BitBoard board(19);
 
@@ -256,3 +269,56 @@ TEST_CASE("BitBoard dilate1_5 corner respects boundaries") {
     // 4 from dilate + 3 distance-2 extensions = 7
     CHECK(dilated.getSetPositions().size() == 7);
 }
+
+TEST_CASE("BitBoard dilateBy matches dilate2 without the source and does not wrap") {
+    static const int offsets[24][2] = {
+        {-1, -1}, {0, -1}, {1, -1}, {-1, 0}, {1, 0}, {-1, 1}, {0, 1}, {1, 1},
+        {-2, -2}, {-2, 0}, {-2, 2}, {0, -2}, {0, 2}, {2, -2}, {2, 0}, {2, 2},
+        {-2, -1}, {-2, 1}, {-1, -2}, {-1, 2}, {1, -2}, {1, 2}, {2, -1}, {2, 1}};
+
+    BitBoard board(19);
+    board.setBit(9, 9);
+    board.setBit(0, 4);   // left edge
+    board.setBit(18, 12); // right edge
+    board.setBit(3, 18);  // bottom row
+
+    BitBoard expected = board.dilate2() & ~board;
+    CHECK(board.dilateBy(offsets, 24).getSetPositions() == expected.getSetPositions());
+
+    // First 8 offsets only: the 3x3 ring
+    BitBoard single(19);
+    single.setBit(18, 12);
+    auto ring = single.dilateBy(offsets, 8).getSetPositions();
+    CHECK(ring.size() == 5);
+    CHECK(single.dilateBy(offsets, 8).getBit(0, 13) == false);
+}
+
+TEST_CASE("BitBoard shiftToward does not wrap across rows") {
+    BitBoard board(19);
+    board.setBit(0, 5);   // left edge
+    board.setBit(18, 7);  // right edge
+
+    // Result bit (x, y) = source bit (x + 1, y): the left-edge stone moves off the board
+    BitBoard right = board.shiftToward<1, 0>();
+    CHECK(right.getBit(17, 7) == true);
+    CHECK(right.getBit(18, 4) == false);
+    CHECK(right.count() == 1);
+
+    BitBoard left = board.shiftToward<-1, 0>();
+    CHECK(left.getBit(1, 5) == true);
+    CHECK(left.getBit(0, 8) == false);
+    CHECK(left.count() == 1);
+
+    BitBoard diag = board.shiftToward<1, -1>();
+    CHECK(diag.getBit(17, 8) == true);
+    CHECK(diag.count() == 1);
+}
+
+TEST_CASE("BitBoard count") {
+    BitBoard board(19);
+    CHECK(board.count() == 0);
+    board.setBit(0, 0);
+    board.setBit(9, 9);
+    board.setBit(18, 18);
+    CHECK(board.count() == 3);
+}
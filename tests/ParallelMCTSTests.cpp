@@ -19,6 +19,47 @@
 #endif
 #include "doctest.h"
 
+// These tests build trees of at most a few hundred nodes: a small arena instead
+// of the multi-GB default keeps each test's setup cheap and lets the suite run
+// on machines with less RAM than the production arena.
+static constexpr size_t kTestArenaSize = 64ull * 1024 * 1024;
+
+// Polls until done() holds instead of sleeping a fixed time and hoping the
+// pipeline threads got there: the tests finish as soon as the work does, and a
+// slow or loaded machine gets up to `timeout` before the test gives up.
+template <typename Pred>
+static bool waitUntil(Pred done, std::chrono::milliseconds timeout = std::chrono::seconds(5)) {
+    const auto deadline = std::chrono::steady_clock::now() + timeout;
+    while (!done()) {
+        if (std::chrono::steady_clock::now() >= deadline) return false;
+        std::this_thread::sleep_for(std::chrono::milliseconds(1));
+    }
+    return true;
+}
+
+TEST_CASE("Evaluator rollouts depend only on the game they start from") {
+    // A rollout draws its moves from the evaluated game's rng, so the same game
+    // must give the same value however many unrelated rollouts ran in between.
+    UniformEvaluator evaluator;
+    PenteGame::Config config = PenteGame::Config::pente();
+    config.seed = 99;
+    PenteGame other(config);
+    other.reset();
+    other.makeMove(9, 9);
+    for (uint32_t seed = 1; seed <= 20; seed++) {
+        config.seed = seed;
+        PenteGame game(config);
+        game.reset();
+        for (int i = 0; i < 6; i++) {
+            PenteGame::Move m = game.getRandomPromisingMove();
+            game.makeMove(m.x, m.y);
+        }
+        float first = evaluator.evaluateValue(game);
+        evaluator.evaluateValue(other);
+        CHECK(evaluator.evaluateValue(game) == first);
+    }
+}
+
 TEST_CASE("search returns a valid move after completing all iterations") {
     PenteGame game(PenteGame::Config::pente());
     game.reset();
@@ -29,6 +70,7 @@ TEST_CASE("search returns a valid move after completing all iterations") {
     config.numWorkerThreads = 2;
     config.numEvalThreads = 1;
     config.maxIterations = 10;
+    config.arenaSize = kTestArenaSize;
     config.evaluator = &evaluator;
 
     ParallelMCTS mcts(config);
@@ -49,6 +91,7 @@ TEST_CASE("prepareRoot expands root with evaluated policy and value") {
     HeuristicEvaluator evaluator;
 
     ParallelMCTS::Config config;
+    config.arenaSize = kTestArenaSize;
     config.evaluator = &evaluator;
 
     ParallelMCTS mcts(config);
@@ -72,6 +115,66 @@ TEST_CASE("prepareRoot expands root with evaluated policy and value") {
     CHECK(mcts.getTreeSize() == 1);
 }
 
+TEST_CASE("search returns an immediate win without running simulations") {
+    PenteGame game(PenteGame::Config::gomoku());
+    game.reset();
+    // Black has an open four on row 10; White's stones are nowhere near it.
+    for (const char *m : {"K10", "A1", "L10", "C1", "M10", "E1", "N10", "G1"})
+        game.makeMove(m);
+
+    HeuristicEvaluator evaluator;
+    ParallelMCTS::Config config;
+    config.numWorkerThreads = 2;
+    config.numEvalThreads = 0;
+    config.maxIterations = 500;
+    config.arenaSize = kTestArenaSize;
+    config.evaluator = &evaluator;
+
+    ParallelMCTS mcts(config);
+    PenteGame::Move move = mcts.search(game);
+
+    PenteGame after = game;
+    after.makeMove(move.x, move.y);
+    CHECK(after.getWinner() == PenteGame::BLACK);
+    CHECK(mcts.getRoot()->isTerminal());
+    // Root plus the proven winning child: no simulation expanded anything else.
+    CHECK(mcts.getTreeSize() == 2);
+}
+
+TEST_CASE("prepareRoot proves an immediate win on a reused root") {
+    PenteGame::Config gameConfig = PenteGame::Config::pente();
+    gameConfig.tournamentRule = false;
+    PenteGame game(gameConfig);
+    game.reset();
+    // Black has an open four on row 10 and White cannot capture into it, so
+    // whatever White plays, Black wins next move.
+    for (const char *m : {"K10", "A1", "L10", "C1", "M10", "E1", "N10"})
+        game.makeMove(m);
+
+    HeuristicEvaluator evaluator;
+    ParallelMCTS::Config config;
+    config.numWorkerThreads = 1;
+    config.numEvalThreads = 0;
+    config.maxIterations = 1;  // expand one White reply, nothing below it
+    config.arenaSize = kTestArenaSize;
+    config.evaluator = &evaluator;
+
+    ParallelMCTS mcts(config);
+    PenteGame::Move reply = mcts.search(game);
+    REQUIRE_FALSE(mcts.getRoot()->isTerminal());
+
+    mcts.reuseSubtree(reply);
+    game.makeMove(reply.x, reply.y);
+    REQUIRE(mcts.getRoot()->positionHash == game.getHash());
+    REQUIRE_FALSE(mcts.getRoot()->isTerminal());
+
+    mcts.prepareRoot(game);
+    CHECK(mcts.getRoot()->isTerminal());
+    PenteGame::Move win = mcts.getBestMove();
+    game.makeMove(win.x, win.y);
+    CHECK(game.getWinner() == PenteGame::BLACK);
+}
+
 TEST_CASE("Worker thread selects leaf, applies virtual loss, pushes to eval queue") {
     PenteGame game(PenteGame::Config::pente());
     game.reset();
@@ -82,16 +185,21 @@ TEST_CASE("Worker thread selects leaf, applies virtual loss, pushes to eval queu
     config.numWorkerThreads = 1;
     config.numEvalThreads = 1;  // queue mode: worker pushes to eval queue
     config.maxIterations = 1;
+    config.arenaSize = kTestArenaSize;
     config.evaluator = &evaluator;
 
     ParallelMCTS mcts(config);
     mcts.prepareRoot(game);  // root expanded with N children slots (all null)
 
     mcts.startWorkerThreads();
-    std::this_thread::sleep_for(std::chrono::milliseconds(50));
+    std::vector<ParallelMCTS::EvaluationRequest> requests;
+    auto collect = [&] {
+        for (auto &req : mcts.drainEvalQueue()) requests.push_back(std::move(req));
+    };
+    CHECK(waitUntil([&] { collect(); return !requests.empty(); }));
     mcts.stopWorkerThreads();
+    collect();
 
-    auto requests = mcts.drainEvalQueue();
     REQUIRE(requests.size() == 1);
     REQUIRE(requests[0].node != nullptr);
     CHECK(requests[0].node->virtualLosses.load() == 1);
@@ -108,6 +216,7 @@ TEST_CASE("Worker completes full iteration: select, eval, expand, backprop") {
     config.numWorkerThreads = 1;
     config.numEvalThreads = 1;
     config.maxIterations = 1;
+    config.arenaSize = kTestArenaSize;
     config.evaluator = &evaluator;
 
     ParallelMCTS mcts(config);
@@ -115,11 +224,13 @@ TEST_CASE("Worker completes full iteration: select, eval, expand, backprop") {
 
     mcts.startEvalThreads();
     mcts.startWorkerThreads();
-    std::this_thread::sleep_for(std::chrono::milliseconds(100));
+    const auto *root = mcts.getRoot();
+    // The worker exits on its own after its one iteration; stopping it joins
+    // the thread, so the whole backprop path is visible once this returns.
+    CHECK(waitUntil([&] { return root->visits.load() >= 1; }));
     mcts.stopWorkerThreads();
     mcts.stopEvalThreads();
 
-    const auto *root = mcts.getRoot();
     CHECK(root->visits.load() == 1);    // backprop propagated up to root
 
     // Find the one child node that was allocated during selection
@@ -142,6 +253,7 @@ TEST_CASE("EvalPool processes request and pushes result to backprop queue") {
 
     ParallelMCTS::Config config;
     config.numEvalThreads = 1;
+    config.arenaSize = kTestArenaSize;
     config.evaluator = &evaluator;
 
     ParallelMCTS mcts(config);
@@ -153,10 +265,14 @@ TEST_CASE("EvalPool processes request and pushes result to backprop queue") {
     mcts.pushEvalRequest(req);
 
     mcts.startEvalThreads();
-    std::this_thread::sleep_for(std::chrono::milliseconds(50));
+    std::vector<ParallelMCTS::EvaluationResult> results;
+    auto collect = [&] {
+        for (auto &res : mcts.drainBackpropQueue()) results.push_back(std::move(res));
+    };
+    CHECK(waitUntil([&] { collect(); return !results.empty(); }));
     mcts.stopEvalThreads();
+    collect();
 
-    auto results = mcts.drainBackpropQueue();
     REQUIRE(results.size() == 1);
     CHECK(results[0].node == nullptr);
     CHECK(results[0].value >= -1.0f);
@@ -164,6 +280,38 @@ TEST_CASE("EvalPool processes request and pushes result to backprop queue") {
     CHECK(!results[0].policy.empty());
 }
 
+TEST_CASE("EvaluationQueue keeps FIFO order across ring wraparound") {
+    ParallelMCTS::EvaluationQueue queue(4);
+
+    std::vector<ParallelMCTS::ThreadSafeNode> nodes(6);
+    ParallelMCTS::EvaluationRequest req;
+    for (int i = 0; i < 4; i++) {
+        req.node = &nodes[i];
+        CHECK(queue.tryPush(req));
+    }
+    req.node = &nodes[4];
+    CHECK_FALSE(queue.tryPush(req));  // at capacity
+
+    auto first = queue.popBatch(3);
+    REQUIRE(first.size() == 3);
+    CHECK(first[0].node == &nodes[0]);
+    CHECK(first[2].node == &nodes[2]);
+
+    // These two pushes land in recycled slots at the front of the ring.
+    req.node = &nodes[4];
+    CHECK(queue.tryPush(req));
+    req.node = &nodes[5];
+    CHECK(queue.tryPush(req));
+    CHECK(queue.size() == 3);
+
+    auto rest = queue.popBatch(10);
+    REQUIRE(rest.size() == 3);
+    CHECK(rest[0].node == &nodes[3]);
+    CHECK(rest[1].node == &nodes[4]);
+    CHECK(rest[2].node == &nodes[5]);
+    CHECK(queue.empty());
+}
+
 TEST_CASE("reuseSubtree preserves child visit counts across searches") {
     PenteGame game(PenteGame::Config::pente());
     game.reset();
@@ -174,6 +322,7 @@ TEST_CASE("reuseSubtree preserves child visit counts across searches") {
     config.numWorkerThreads = 2;
     config.numEvalThreads = 0;
     config.maxIterations = 200;
+    config.arenaSize = kTestArenaSize;
     config.evaluator = &evaluator;
 
     ParallelMCTS mcts(config);
@@ -206,12 +355,31 @@ TEST_CASE("reuseSubtree preserves child visit counts across searches") {
     REQUIRE(mcts.getTotalVisits() == rootVisits);
 }
 
+// Uniform policy and a constant value: no rollout, so every evaluation costs
+// the same and search throughput reflects only the tree, queues and allocator.
+class FixedCostEvaluator final : public Evaluator {
+  public:
+    std::pair<std::vector<std::pair<PenteGame::Move, float>>, float> evaluate(const PenteGame &game) override {
+        return {evaluatePolicy(game), evaluateValue(game)};
+    }
+    std::vector<std::pair<PenteGame::Move, float>> evaluatePolicy(const PenteGame &game) override {
+        const auto &legalMoves = game.getLegalMoves();
+        std::vector<std::pair<PenteGame::Move, float>> policy;
+        policy.reserve(legalMoves.size());
+        for (const auto &move : legalMoves)
+            policy.emplace_back(move, 1.0f / legalMoves.size());
+        return policy;
+    }
+    float evaluateValue(const PenteGame &) override { return 0.0f; }
+};
+
 // Slow (compares many worker configs) - skipped by default, run with --no-skip
 TEST_CASE("Benchmark: parallel speedup across worker counts" * doctest::skip()) {
     PenteGame game(PenteGame::Config::pente());
     game.reset();
 
     HeuristicEvaluator evaluator;
+    FixedCostEvaluator fixedEvaluator;
 
     const int iterations = 100000;
 
@@ -222,13 +390,14 @@ TEST_CASE("Benchmark: parallel speedup across worker counts" * doctest::skip())
         double wallSec;
     };
 
-    auto runConfig = [&](int workers, int evalThreads) -> Result {
+    auto runConfig = [&](int workers, int evalThreads, Evaluator *eval = nullptr) -> Result {
         ParallelMCTS::Config config;
         config.numWorkerThreads = workers;
         config.numEvalThreads   = evalThreads;
         config.maxIterations    = iterations;
-        config.evaluator        = &evaluator;
+        config.evaluator        = eval ? eval : &evaluator;
         config.arenaSize        = 2ull * 1024 * 1024 * 1024;  // 2 GB, enough for 100k iters
+        config.seed             = 42;
 
         ParallelMCTS mcts(config);
         auto start = std::chrono::high_resolution_clock::now();
@@ -273,6 +442,17 @@ TEST_CASE("Benchmark: parallel speedup across worker counts" * doctest::skip())
                   << "    " << r.workers << "w / " << r.evalThreads << "e: "
                   << r.itersPerSec / baseline << "x\n";
     }
+
+    // Same sweep with the rollout taken out: the gap to the table above is the
+    // evaluator's share, what remains is search infrastructure overhead.
+    std::cout << "\n  Fixed-cost evaluator (infrastructure only):\n";
+    for (int workers : {1, 2, 4, 6, 8}) {
+        Result r = runConfig(workers, 0, &fixedEvaluator);
+        std::cout << std::setprecision(1)
+                  << "    " << r.workers << "w / " << r.evalThreads << "e: "
+                  << std::setw(10) << r.itersPerSec << " iters/sec"
+                  << "  (" << std::setprecision(2) << 1e6 / r.itersPerSec << " us/iter)\n";
+    }
     std::cout << "\n";
 }
 
@@ -2,6 +2,8 @@
 #include "PenteGame.hpp"
 #include "Zobrist.hpp"
 #include "TranspositionTable.hpp"
+#include <algorithm>
+#include <tuple>
 
 TEST_CASE("PenteGame initial state") {
     PenteGame game;
@@ -24,6 +26,24 @@ TEST_CASE("PenteGame make move") {
     CHECK(game.getStoneAt(9, 9) == PenteGame::BLACK);
 }
 
+TEST_CASE("PenteGame captured cells can be played again") {
+    PenteGame game;
+    game.reset();
+
+    // B(K10) W(L10) B(J10) W(M10) -> Black N10 captures L10, M10
+    for (const char *m : {"K10", "L10", "J10", "M10", "N10"})
+        game.makeMove(m);
+    REQUIRE(game.getBlackCaptures() == 2);
+    CHECK(game.getStoneAt(10, 9) == PenteGame::NONE);
+
+    const auto &legal = game.getLegalMoves();
+    CHECK(std::any_of(legal.begin(), legal.end(), [](const PenteGame::Move &m) { return m.x == 10 && m.y == 9; }));
+
+    CHECK(game.makeMove("L10") == true);
+    CHECK(game.getStoneAt(10, 9) == PenteGame::WHITE);
+    CHECK(game.makeMove("L10") == false);  // now occupied
+}
+
 TEST_CASE("PenteGame config presets") {
     PenteGame pente(PenteGame::Config::pente());
     CHECK(pente.getConfig().capturesToWin == 10);
@@ -50,16 +70,14 @@ TEST_CASE("PenteGame getPromisingMoves distance 2") {
     // 5x5 = 25, minus 1 occupied = 24 promising moves
     CHECK(moves.size() == 24);
 
-    // Verify all moves are within distance 2 of (9,9)
-    for (const auto& move : moves) {
-        int dx = std::abs(move.x - 9);
-        int dy = std::abs(move.y - 9);
-        CHECK(dx <= 2);
-        CHECK(dy <= 2);
-        // Should not include the occupied square
-        bool isOccupied = (move.x == 9 && move.y == 9);
-        CHECK_FALSE(isOccupied);
-    }
+    // Collect the moves as a set: 24 distinct cells, none of them outside the
+    // 5x5 area or on the occupied square.
+    BitBoard stone, seen;
+    stone.setBit(9, 9);
+    for (const auto &move : moves)
+        seen.setBit(move.x, move.y);
+    CHECK(seen.count() == 24);
+    CHECK((seen & ~(stone.dilate2() & ~stone)).count() == 0);
 }
 
 TEST_CASE("PenteGame evaluateMove no captures") {
@@ -193,6 +211,131 @@ TEST_CASE("PenteGame evaluateMove detects block of open three") {
     CHECK(game.evaluateMove(blockMove) == doctest::Approx(35.95f));
 }
 
+TEST_CASE("PenteGame five in a row wins along every direction and board edge") {
+    // Black's five cells per line, played in this order (the last one lands
+    // inside the line, so both walks through it have to count).
+    const std::vector<std::vector<std::pair<int, int>>> lines = {
+        {{0, 0}, {1, 0}, {3, 0}, {4, 0}, {2, 0}},           // bottom edge, horizontal
+        {{18, 14}, {18, 15}, {18, 17}, {18, 18}, {18, 16}}, // right edge, vertical
+        {{14, 14}, {15, 15}, {16, 16}, {18, 18}, {17, 17}}, // into the top-right corner
+        {{0, 4}, {1, 3}, {3, 1}, {4, 0}, {2, 2}},           // anti-diagonal into the bottom-left corner
+    };
+    for (const auto &line : lines) {
+        PenteGame game;
+        game.reset();
+        for (size_t i = 0; i < line.size(); i++) {
+            CHECK(game.getWinner() == PenteGame::NONE);
+            game.makeMove(line[i].first, line[i].second);
+            if (i + 1 < line.size())
+                game.makeMove(5 + 2 * static_cast<int>(i), 9); // White, well away from the line
+        }
+        CHECK(game.getWinner() == PenteGame::BLACK);
+    }
+}
+
+TEST_CASE("PenteGame evaluateMove matches recorded scores from the countConsecutive scorer") {
+    // Positions from seeded random play, with the score of every legal move as
+    // produced by the bitboard/countConsecutive evaluateMove that predates the
+    // cell-map scorer. Moves not listed scored the default 1.0.
+    struct Recorded {
+        std::vector<std::pair<int, int>> moves;
+        int defaultCount;
+        std::vector<std::tuple<int, int, float>> scores;
+    };
+    const std::vector<Recorded> positions = {
+        {
+            {{9, 9}, {10, 10}, {12, 8}, {7, 11}, {5, 13}, {8, 10}, {11, 8}, {7, 12}, {6, 8}, {6, 9}, {10, 12}, {13, 7},
+             {11, 6}, {6, 6}, {5, 14}, {9, 11}, {3, 12}, {6, 4}, {5, 6}, {4, 13}, {10, 7}, {8, 12}, {4, 4}, {4, 14}},
+            95,
+            {{9, 8, 61.0f}, {10, 8, 16.0f}, {8, 9, 16.0f}, {9, 10, 0.5f}, {7, 9, 0.5f},
+             {11, 7, 16.0f}, {11, 9, 35.95f}, {10, 11, 0.5f}, {8, 5, 16.0f}, {13, 8, 16.0f},
+             {12, 9, 16.0f}, {14, 8, 16.0f}, {6, 12, 7.0f}, {13, 10, 16.0f}, {5, 11, 16.0f},
+             {7, 13, 20.95f}, {5, 12, 16.0f}, {6, 13, 0.5f}, {5, 15, 16.0f}, {9, 6, 16.0f},
+             {9, 12, 0.5f}, {13, 4, 16.0f}, {11, 5, 16.0f}, {12, 5, 16.0f}, {5, 5, 0.5f},
+             {5, 16, 16.0f}, {5, 4, 0.5f}},
+        },
+        {
+            {{9, 9}, {9, 11}, {7, 9}, {5, 9}, {3, 11}, {3, 13}, {10, 9}, {1, 9}, {4, 10}, {9, 8}, {11, 6}, {2, 14},
+             {10, 11}, {10, 5}, {11, 12}, {5, 11}, {11, 10}, {10, 10}, {13, 6}, {0, 12}, {1, 7}, {10, 6}, {5, 13}, {15, 8},
+             {2, 11}, {12, 13}, {16, 7}, {14, 8}, {9, 10}, {6, 14}, {2, 9}, {14, 15}, {9, 5}, {4, 8}, {12, 7}, {3, 14},
+             {8, 4}, {4, 6}, {9, 3}, {11, 7}, {8, 10}},
+            134,
+            {{10, 8, 0.5f}, {7, 11, 16.0f}, {11, 9, 35.95f}, {8, 12, 16.0f}, {6, 8, 7.0f},
+             {6, 9, 0.95f}, {6, 10, 0.5f}, {7, 10, 7.0f}, {5, 8, 16.0f}, {4, 9, 0.5f},
+             {5, 10, 16.0f}, {3, 7, 61.0f}, {2, 10, 0.5f}, {4, 11, 0.5f}, {2, 12, 7.0f},
+             {4, 12, 21.0f}, {12, 11, 7.0f}, {4, 13, 0.5f}, {13, 8, 22.0f}, {4, 14, 16.0f},
+             {1, 15, 16.0f}, {3, 15, 16.0f}, {11, 8, 200.0f}, {5, 12, 0.5f}, {10, 7, 0.5f},
+             {1, 8, 0.5f}, {2, 8, 16.0f}, {17, 8, 16.0f}, {12, 8, 68.98f}, {1, 14, 16.0f},
+             {10, 4, 16.0f}, {10, 3, 16.0f}, {14, 7, 0.5f}, {2, 6, 16.0f}, {4, 7, 16.0f},
+             {16, 8, 16.0f}, {7, 3, 7.0f}, {3, 16, 16.0f}, {4, 5, 16.0f}},
+        },
+        {
+            {{9, 9}, {10, 9}, {12, 7}, {11, 7}, {10, 5}, {11, 6}, {11, 4}, {8, 5}, {13, 9}, {9, 2}, {10, 10}, {11, 2},
+             {10, 1}, {7, 9}, {10, 7}, {13, 8}, {8, 12}, {11, 11}, {5, 7}, {3, 7}, {8, 3}, {5, 6}, {5, 5}, {6, 14},
+             {13, 11}, {1, 9}, {11, 1}, {4, 7}, {9, 0}, {7, 13}, {4, 4}, {12, 2}, {4, 14}, {5, 3}, {8, 8}, {9, 13},
+             {5, 2}, {7, 8}, {9, 1}, {4, 5}, {15, 6}, {4, 8}, {16, 7}, {13, 7}, {10, 4}, {16, 6}, {13, 6}, {9, 5},
+             {14, 6}, {1, 5}, {6, 9}, {8, 2}, {12, 8}, {1, 3}, {1, 6}, {9, 6}, {10, 0}, {2, 5}, {13, 13}, {15, 9},
+             {5, 11}, {17, 8}, {3, 3}},
+            127,
+            {{10, 8, 0.95f}, {7, 7, 42.6f}, {7, 11, 16.0f}, {9, 7, 16.0f}, {14, 9, 0.5f},
+             {11, 9, 16.0f}, {11, 8, 0.5f}, {12, 11, 0.5f}, {12, 3, 7.0f}, {12, 6, 0.5f},
+             {5, 9, 16.0f}, {6, 7, 21.0f}, {14, 5, 7.0f}, {10, 6, 16.0f}, {9, 4, 61.0f},
+             {13, 2, 66.0f}, {10, 3, 15.95f}, {11, 3, 0.5f}, {7, 4, 8.98f}, {8, 4, 0.5f},
+             {7, 5, 8.98f}, {7, 6, 16.0f}, {8, 6, 16.0f}, {6, 5, 16.0f}, {12, 10, 0.5f},
+             {14, 10, 0.5f}, {8, 1, 20.95f}, {10, 2, 200.0f}, {9, 3, 0.5f}, {7, 2, 66.0f},
+             {4, 9, 16.0f}, {10, 12, 16.0f}, {12, 1, 20.95f}, {6, 8, 0.5f}, {6, 10, 16.0f},
+             {7, 10, 16.0f}, {2, 3, 0.5f}, {8, 13, 16.0f}, {6, 12, 0.5f}, {8, 14, 16.0f},
+             {6, 6, 47.55f}, {5, 8, 0.5f}, {3, 5, 21.0f}, {2, 6, 21.0f}, {3, 6, 16.0f},
+             {2, 7, 8.98f}, {2, 8, 16.0f}, {3, 8, 16.0f}, {3, 4, 16.0f}, {6, 13, 16.0f},
+             {5, 14, 0.5f}, {5, 15, 8.98f}, {2, 9, 16.0f}, {4, 3, 0.5f}, {2, 2, 20.95f},
+             {2, 4, 0.5f}, {14, 2, 16.0f}, {10, 13, 16.0f}, {4, 10, 16.0f}, {1, 4, 16.0f}},
+        },
+    };
+    for (const auto &pos : positions) {
+        PenteGame game;
+        game.reset();
+        for (auto [x, y] : pos.moves)
+            REQUIRE(game.makeMove(x, y));
+
+        const auto &legal = game.getLegalMoves();
+        std::vector<float> batch;
+        game.evaluateMoves(legal, batch);
+        int defaults = 0;
+        for (size_t i = 0; i < legal.size(); i++) {
+            float expected = 1.0f;
+            for (const auto &[x, y, score] : pos.scores)
+                if (legal[i].x == x && legal[i].y == y)
+                    expected = score;
+            if (expected == 1.0f)
+                defaults++;
+            CHECK(game.evaluateMove(legal[i]) == doctest::Approx(expected));
+            CHECK(batch[i] == doctest::Approx(expected));
+        }
+        CHECK(defaults == pos.defaultCount);
+    }
+}
+
+TEST_CASE("PenteGame evaluateMoves matches evaluateMove") {
+    PenteGame::Config config = PenteGame::Config::pente();
+    for (int g = 0; g < 10; g++) {
+        config.seed = 777 + g;
+        PenteGame game(config);
+        game.reset();
+        while (!game.isGameOver() && game.getMoveCount() < 80) {
+            const auto &moves = game.getLegalMoves();
+            std::vector<float> scores;
+            game.evaluateMoves(moves, scores);
+            std::vector<float> expected;
+            for (const auto &move : moves)
+                expected.push_back(game.evaluateMove(move));
+            CHECK(scores == expected);
+
+            PenteGame::Move m = game.getRandomPromisingMove();
+            game.makeMove(m.x, m.y);
+        }
+    }
+}
+
 TEST_CASE("PenteGame evaluateMove verifies capture pattern") {
     PenteGame game;
     game.reset();
@@ -258,6 +401,44 @@ TEST_CASE("PenteGame countOpenFours detects open four") {
     CHECK(game.countOpenFours(PenteGame::WHITE) == 0);
 }
 
+TEST_CASE("PenteGame countOpenFours matches a cell-by-cell scan") {
+    // Reference: probe every stone in every direction for _XXXX / XXXX_ with
+    // the end cells in bounds, as the scalar implementation did.
+    auto reference = [](const PenteGame &g, PenteGame::Player player) {
+        PenteGame::Player opp = (player == PenteGame::BLACK) ? PenteGame::WHITE : PenteGame::BLACK;
+        auto at = [&](int x, int y, PenteGame::Player p) {
+            return x >= 0 && x < PenteGame::BOARD_SIZE && y >= 0 && y < PenteGame::BOARD_SIZE && g.getStoneAt(x, y) == p;
+        };
+        auto empty = [&](int x, int y) {
+            return x >= 0 && x < PenteGame::BOARD_SIZE && y >= 0 && y < PenteGame::BOARD_SIZE &&
+                   !at(x, y, player) && !at(x, y, opp);
+        };
+        const int dirs[4][2] = {{1, 0}, {0, 1}, {1, 1}, {1, -1}};
+        int n = 0;
+        for (int y = 0; y < PenteGame::BOARD_SIZE; y++)
+            for (int x = 0; x < PenteGame::BOARD_SIZE; x++)
+                for (auto [dx, dy] : dirs) {
+                    bool four = true;
+                    for (int k = 0; k < 4; k++) four = four && at(x + k * dx, y + k * dy, player);
+                    if (four && (empty(x - dx, y - dy) || empty(x + 4 * dx, y + 4 * dy))) n++;
+                }
+        return n;
+    };
+
+    PenteGame::Config config = PenteGame::Config::pente();
+    for (int g = 0; g < 20; g++) {
+        config.seed = 12345 + g;
+        PenteGame game(config);
+        game.reset();
+        while (!game.isGameOver() && game.getMoveCount() < 120) {
+            PenteGame::Move m = game.getRandomPromisingMove();
+            game.makeMove(m.x, m.y);
+            CHECK(game.countOpenFours(PenteGame::BLACK) == reference(game, PenteGame::BLACK));
+            CHECK(game.countOpenFours(PenteGame::WHITE) == reference(game, PenteGame::WHITE));
+        }
+    }
+}
+
 TEST_CASE("PenteGame evaluatePosition open four advantage") {
     // INCOMPLETE: evaluatePosition now returns binary values
     PenteGame game;
@@ -189,4 +189,33 @@ TEST_CASE("SelfPlay - policy visits at least 5 moves in opening") {
     }
 }
 
+TEST_CASE("NNEvaluator - position cache repeats results and keeps variants apart") {
+    NNEvaluator eval;
+    eval.setCacheCapacity(64);
+
+    // Same stones in both games, but pente's tournament rule restricts move 3,
+    // so the two legal-move lists (and the policies filtered to them) differ.
+    PenteGame pente(PenteGame::Config::pente());
+    PenteGame gomoku(PenteGame::Config::gomoku());
+    for (PenteGame *g : {&pente, &gomoku}) {
+        g->reset();
+        g->makeMove(9, 9);
+        g->makeMove(10, 10);
+    }
+    REQUIRE(pente.getHash() == gomoku.getHash());
+    REQUIRE(pente.getLegalMoves().size() != gomoku.getLegalMoves().size());
+
+    auto first  = eval.evaluate(pente);
+    auto cached = eval.evaluate(pente);
+    CHECK(cached.second == first.second);
+    REQUIRE(cached.first.size() == first.first.size());
+    for (size_t i = 0; i < first.first.size(); i++) {
+        CHECK(cached.first[i].first.x == first.first[i].first.x);
+        CHECK(cached.first[i].first.y == first.first[i].first.y);
+        CHECK(cached.first[i].second == first.first[i].second);
+    }
+
+    CHECK(eval.evaluate(gomoku).first.size() == gomoku.getLegalMoves().size());
+}
+
 #endif // WITH_TORCH